@@ -0,0 +1,19 @@
+-- Add indexes used by fixture and team imports
+-- The import existence check looks fixtures up by organization, team and
+-- kickoff time, then checks each fixture for an existing task. Team CSV
+-- imports look teams up by lowercased name.
+--
+-- Earlier versions of this file created the fixture and task indexes as
+-- UNIQUE; those are replaced by the plain indexes below.
+
+DROP INDEX IF EXISTS idx_tasks_fixture_unique;
+DROP INDEX IF EXISTS idx_fixtures_org_team_kickoff;
+
+CREATE INDEX IF NOT EXISTS idx_fixtures_org_team_kickoff
+    ON fixtures(organization_id, team_id, kickoff_datetime);
+
+CREATE INDEX IF NOT EXISTS idx_tasks_fixture
+    ON tasks(fixture_id);
+
+CREATE INDEX IF NOT EXISTS idx_teams_org_lower_name
+    ON teams(organization_id, lower(name));
@@ -0,0 +1,13 @@
+-- Add the pending_uploads table used by bulk coach uploads
+-- Uploaded CSV text is kept here between the upload, mapping and confirm
+-- steps, so any app instance can serve the next step.
+
+CREATE TABLE IF NOT EXISTS pending_uploads (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    csv_data TEXT NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_pending_uploads_created
+    ON pending_uploads(created_at);
@@ -358,7 +358,11 @@ class ContactParser:
             'notes': self._find_column(df.columns, ['notes', 'comments', 'remarks', 'additional info'])
         }
         
-        for index, row in df.iterrows():
+        columns = list(df.columns)
+        
+        # itertuples avoids building a Series for every row
+        for values in df.itertuples(index=False, name=None):
+            row = dict(zip(columns, values))
             contact = ContactInfo()
             
             # Extract data from mapped columns
@@ -379,7 +383,7 @@ class ContactParser:
             
             # If no clear column mapping, try to extract from all text in the row
             if not any([contact.team_name, contact.contact_name, contact.email, contact.phone]):
-                row_text = ' '.join([str(val) for val in row.values if pd.notna(val)])
+                row_text = ' '.join([str(val) for val in values if pd.notna(val)])
                 parsed_contact = self._parse_single_contact(row_text)
                 if parsed_contact:
                     contact = parsed_contact
@@ -199,6 +199,14 @@ CREATE TABLE usage_analytics (
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
 
+-- CSV text kept between the steps of a bulk upload
+CREATE TABLE pending_uploads (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    csv_data TEXT NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
 -- Create indexes for performance
 CREATE INDEX idx_users_email ON users(email);
 CREATE INDEX idx_users_google_id ON users(google_id);
@@ -207,10 +215,12 @@ CREATE INDEX idx_organizations_owner ON organizations(owner_id);
 CREATE INDEX idx_user_organizations_user ON user_organizations(user_id);
 CREATE INDEX idx_user_organizations_org ON user_organizations(organization_id);
 CREATE INDEX idx_teams_org ON teams(organization_id);
+CREATE INDEX idx_teams_org_lower_name ON teams(organization_id, lower(name));
 CREATE INDEX idx_pitches_org ON pitches(organization_id);
 CREATE INDEX idx_fixtures_org ON fixtures(organization_id);
 CREATE INDEX idx_fixtures_team ON fixtures(team_id);
 CREATE INDEX idx_fixtures_datetime ON fixtures(kickoff_datetime);
+CREATE INDEX idx_fixtures_org_team_kickoff ON fixtures(organization_id, team_id, kickoff_datetime);
 CREATE INDEX idx_tasks_org ON tasks(organization_id);
 CREATE INDEX idx_tasks_fixture ON tasks(fixture_id);
 CREATE INDEX idx_tasks_status ON tasks(status);
@@ -224,6 +234,7 @@ CREATE INDEX idx_support_tickets_status ON support_tickets(status);
 CREATE INDEX idx_usage_analytics_org ON usage_analytics(organization_id);
 CREATE INDEX idx_usage_analytics_user ON usage_analytics(user_id);
 CREATE INDEX idx_usage_analytics_created ON usage_analytics(created_at);
+CREATE INDEX idx_pending_uploads_created ON pending_uploads(created_at);
 
 -- Create functions for updated_at timestamps
 CREATE OR REPLACE FUNCTION update_updated_at_column()
@@ -27,10 +27,11 @@ class FixtureParser:
             19: 'Home Team Contact 7'
         }
     
-    def read_spreadsheet(self, file_path: str) -> pd.DataFrame:
-        """Read spreadsheet and apply proper column names"""
+    def read_spreadsheet(self, file_path, filename: Optional[str] = None) -> pd.DataFrame:
+        """Read spreadsheet and apply proper column names.
+        file_path may also be an open binary file, with filename giving its name."""
         try:
-            if file_path.endswith('.csv'):
+            if (filename or file_path).endswith('.csv'):
                 df = pd.read_csv(file_path, header=None)
             else:
                 df = pd.read_excel(file_path, header=None)
@@ -72,8 +73,11 @@ class FixtureParser:
     def get_fixture_data(self, df: pd.DataFrame) -> List[Dict]:
         """Convert filtered dataframe to list of fixture dictionaries"""
         fixtures = []
+        columns = list(df.columns)
         
-        for _, row in df.iterrows():
+        # itertuples avoids building a Series for every row
+        for values in df.itertuples(index=False, name=None):
+            row = dict(zip(columns, values))
             # Clean and process the data
             fixture = {
                 'team': self._clean_value(row['Team']),
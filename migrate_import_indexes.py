@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Migration script to add the fixture/task and team indexes used by imports.
+Run this script after deploying the updated models.py.
+
+Usage:
+python migrate_import_indexes.py
+"""
+
+import os
+import sys
+from sqlalchemy import create_engine, text
+
+def run_migration():
+    """Add indexes on fixtures(organization_id, team_id, kickoff_datetime), tasks(fixture_id) and teams(organization_id, lower(name))"""
+    try:
+        # Get database URL from environment
+        database_url = os.environ.get('DATABASE_URL')
+        if not database_url:
+            print("Error: DATABASE_URL environment variable not set")
+            return False
+
+        print(f"Connecting to database...")
+        engine = create_engine(database_url)
+
+        with engine.connect() as conn:
+            # Read migration SQL
+            with open('add_import_indexes.sql', 'r') as f:
+                sql = f.read()
+
+            print("Running migration...")
+            conn.execute(text(sql))
+            conn.commit()
+
+        print("✅ Import indexes added successfully!")
+        return True
+
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        return False
+
+if __name__ == "__main__":
+    success = run_migration()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Migration script to add the pending_uploads table used by bulk coach uploads.
+Run this script after deploying the updated models.py.
+
+Usage:
+python migrate_pending_uploads.py
+"""
+
+import os
+import sys
+from sqlalchemy import create_engine, text
+
+def run_migration():
+    """Add the pending_uploads table and its created_at index"""
+    try:
+        # Get database URL from environment
+        database_url = os.environ.get('DATABASE_URL')
+        if not database_url:
+            print("Error: DATABASE_URL environment variable not set")
+            return False
+
+        print(f"Connecting to database...")
+        engine = create_engine(database_url)
+
+        with engine.connect() as conn:
+            # Read migration SQL
+            with open('add_pending_uploads.sql', 'r') as f:
+                sql = f.read()
+
+            print("Running migration...")
+            conn.execute(text(sql))
+            conn.commit()
+
+        print("✅ Pending uploads table added successfully!")
+        return True
+
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        return False
+
+if __name__ == "__main__":
+    success = run_migration()
+    sys.exit(0 if success else 1)
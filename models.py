@@ -2,7 +2,8 @@
 SQLAlchemy models for Withdean Football Fixtures Multi-Tenant SaaS
 """
 
-from sqlalchemy import create_engine, Column, String, Text, Boolean, DateTime, ForeignKey, CheckConstraint, UniqueConstraint
+from sqlalchemy import create_engine, Column, String, Text, Boolean, DateTime, ForeignKey, CheckConstraint, UniqueConstraint, Index
+from sqlalchemy.engine import make_url
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker
@@ -113,6 +114,8 @@ class Team(Base):
     
     __table_args__ = (
         UniqueConstraint('organization_id', 'name'),
+        # Team CSV imports match names case-insensitively (see add_import_indexes.sql)
+        Index('idx_teams_org_lower_name', 'organization_id', func.lower(name)),
     )
     
     # Relationships
@@ -219,6 +222,8 @@ class Fixture(Base):
     __table_args__ = (
         CheckConstraint("home_away IN ('Home', 'Away')", name='check_home_away'),
         CheckConstraint("status IN ('pending', 'waiting', 'in_progress', 'completed', 'cancelled')", name='check_fixture_status'),
+        # Import existence checks look fixtures up by team and kickoff (see add_import_indexes.sql)
+        Index('idx_fixtures_org_team_kickoff', 'organization_id', 'team_id', 'kickoff_datetime'),
     )
     
     # Relationships
@@ -251,6 +256,8 @@ class Task(Base):
     __table_args__ = (
         CheckConstraint("task_type IN ('home_email', 'away_email')", name='check_task_type'),
         CheckConstraint("status IN ('pending', 'waiting', 'in_progress', 'completed')", name='check_task_status'),
+        # Imports check for a fixture's existing task (see add_import_indexes.sql)
+        Index('idx_tasks_fixture', 'fixture_id'),
     )
     
     # Relationships
@@ -403,13 +410,35 @@ class UsageAnalytics(Base):
         return f"<UsageAnalytics(action='{self.action}', user_id='{self.user_id}')>"
 
 
+class PendingUpload(Base):
+    """CSV text kept between the upload, mapping and confirm steps of a bulk upload"""
+    __tablename__ = 'pending_uploads'
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
+    csv_data = Column(Text, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    __table_args__ = (
+        Index('idx_pending_uploads_created', 'created_at'),
+    )
+    
+    def __repr__(self):
+        return f"<PendingUpload(id='{self.id}', user_id='{self.user_id}')>"
+
+
 # Database configuration and session setup
 class DatabaseManager:
     """Database manager for handling connections and sessions"""
     
     def __init__(self, database_url: str):
         self.database_url = database_url
-        self.engine = create_engine(database_url, echo=False)
+        # On psycopg2, also batch executemany UPDATEs (e.g. bulk updates by
+        # primary key) rather than running them one statement at a time
+        engine_options = {}
+        if make_url(database_url).get_driver_name() == 'psycopg2':
+            engine_options['executemany_mode'] = 'values_plus_batch'
+        self.engine = create_engine(database_url, echo=False, **engine_options)
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
     
     def create_tables(self):
@@ -460,5 +489,34 @@ def get_or_create_team(session, organization_id: str, team_name: str, is_managed
         )
         session.add(team)
         session.commit()
-    
+
     return team
+
+def get_or_create_teams(session, organization_id: str, team_names, is_managed: bool = False) -> Dict[str, Team]:
+    """Get or create several teams within an organization with a single lookup query.
+
+    Returns a dict mapping each stripped team name to its Team. New teams are
+    flushed (not committed) so the caller controls the transaction.
+    """
+    names = {name.strip() for name in team_names if name and name.strip()}
+    if not names:
+        return {}
+
+    teams_by_name = {
+        team.name: team
+        for team in session.query(Team).filter(
+            Team.organization_id == organization_id,
+            Team.name.in_(names)
+        ).all()
+    }
+
+    missing = [
+        Team(organization_id=organization_id, name=name, is_managed=is_managed)
+        for name in sorted(names) if name not in teams_by_name
+    ]
+    if missing:
+        session.add_all(missing)
+        session.flush()
+        teams_by_name.update((team.name, team) for team in missing)
+
+    return teams_by_name
@@ -324,6 +324,40 @@ def create_or_update_fixture(session, org_id: str, team_id: str, fixture_data: d
         return None
 
 
+def save_team_fixtures(session, team: Team, scraped_fixtures: list, result: dict):
+    """Create or update a team's scraped fixtures and their tasks in session, counting them in result"""
+    org_id = str(team.organization_id)
+    team_id = str(team.id)
+    
+    for fixture_data in scraped_fixtures:
+        fixture = create_or_update_fixture(session, org_id, team_id, fixture_data)
+        if fixture:
+            # Check if fixture has tasks, create if missing
+            from models import Task
+            existing_task = session.query(Task).filter_by(
+                fixture_id=fixture.id
+            ).first()
+            
+            if not existing_task:
+                # Create task for this fixture
+                task_type = 'home_email' if fixture.home_away == 'Home' else 'away_email'
+                task_status = 'pending' if fixture.home_away == 'Home' else 'waiting'
+                
+                new_task = Task(
+                    organization_id=UUID(org_id),
+                    fixture_id=fixture.id,
+                    task_type=task_type,
+                    status=task_status
+                )
+                session.add(new_task)
+                logger.debug(f"Created task for fixture {fixture.id}")
+            
+            if fixture.created_at == fixture.updated_at:
+                result['fixtures_created'] += 1
+            else:
+                result['fixtures_updated'] += 1
+
+
 def refresh_team_fixtures(team: Team, headless: bool = True) -> dict:
     """
     Refresh fixtures for a single team
@@ -376,46 +410,16 @@ def refresh_team_fixtures(team: Team, headless: bool = True) -> dict:
         session = db_manager.get_session()
         
         try:
-            org_id = str(team.organization_id)
-            team_id = str(team.id)
-            
-            for fixture_data in scraped_fixtures:
-                fixture = create_or_update_fixture(session, org_id, team_id, fixture_data)
-                if fixture:
-                    # Check if fixture has tasks, create if missing
-                    from models import Task
-                    existing_task = session.query(Task).filter_by(
-                        fixture_id=fixture.id
-                    ).first()
-                    
-                    if not existing_task:
-                        # Create task for this fixture
-                        task_type = 'home_email' if fixture.home_away == 'Home' else 'away_email'
-                        task_status = 'pending' if fixture.home_away == 'Home' else 'waiting'
-                        
-                        new_task = Task(
-                            organization_id=UUID(org_id),
-                            fixture_id=fixture.id,
-                            task_type=task_type,
-                            status=task_status
-                        )
-                        session.add(new_task)
-                        logger.debug(f"Created task for fixture {fixture.id}")
-                    
-                    if fixture.created_at == fixture.updated_at:
-                        result['fixtures_created'] += 1
-                    else:
-                        result['fixtures_updated'] += 1
-            
+            save_team_fixtures(session, team, scraped_fixtures, result)
             session.commit()
-            result['success'] = True
-            logger.info(f"Successfully saved fixtures for {team.name}: {result['fixtures_created']} created, {result['fixtures_updated']} updated")
-            
         except Exception as e:
             session.rollback()
             raise
         finally:
             session.close()
+        
+        result['success'] = True
+        logger.info(f"Successfully saved fixtures for {team.name}: {result['fixtures_created']} created, {result['fixtures_updated']} updated")
             
     except Exception as e:
         result['error'] = str(e)
@@ -462,6 +466,119 @@ def refresh_all_teams_fixtures(headless: bool = True) -> List[dict]:
     return results
 
 
+def save_club_fixtures(session, organization: Organization, scraped_fixtures: list, result: dict) -> bool:
+    """
+    Match scraped club fixtures to the organization's managed teams and
+    create or update them and their tasks in session, counting them in
+    result. Returns False if there are no managed teams to match against.
+    """
+    # Get all managed teams for this organization
+    managed_teams = session.query(Team).filter_by(
+        organization_id=organization.id,
+        is_managed=True
+    ).all()
+    
+    logger.info(f"Found {len(managed_teams)} managed teams to match against")
+    
+    if not managed_teams:
+        result['error'] = "No managed teams found"
+        return False
+    
+    org_id = str(organization.id)
+    
+    # Helper function to extract team identifier
+    def extract_team_identifier(name):
+        if not name:
+            return ""
+        match = re.search(r'(U\d+\s*(?:Black|White|Red|Blue|Green)?)', name, re.IGNORECASE)
+        if match:
+            return match.group(1).strip().lower()
+        return name.lower()
+    
+    def clean_team_name(name):
+        if not name:
+            return ""
+        name = name.strip()
+        name = re.sub(r'^Withdean\s+Youth\s+', '', name, flags=re.IGNORECASE)
+        name = re.sub(r'^Withdean\s+', '', name, flags=re.IGNORECASE)
+        parts = re.split(r'\s{2,}', name)
+        if parts:
+            name = parts[0].strip()
+        return name.strip()
+    
+    # Match each fixture to a managed team
+    matched_teams = set()
+    
+    for fixture_data in scraped_fixtures:
+        home_team = fixture_data.get('home_team', '').strip()
+        away_team = fixture_data.get('away_team', '').strip()
+        
+        # Try to match against each managed team
+        matched_team = None
+        
+        for team in managed_teams:
+            team_name_clean = clean_team_name(team.name)
+            team_id = extract_team_identifier(team.name)
+            
+            home_team_clean = clean_team_name(home_team)
+            away_team_clean = clean_team_name(away_team)
+            
+            home_id = extract_team_identifier(home_team)
+            away_id = extract_team_identifier(away_team)
+            
+            # Check if managed team matches home or away team
+            home_match = (
+                team_id == home_id if (team_id and home_id) else False
+            ) or (
+                team_name_clean.lower() == home_team_clean.lower()
+            ) or (
+                team_name_clean.lower() in home_team_clean.lower() and len(team_name_clean) >= 5
+            )
+            
+            away_match = (
+                team_id == away_id if (team_id and away_id) else False
+            ) or (
+                team_name_clean.lower() == away_team_clean.lower()
+            ) or (
+                team_name_clean.lower() in away_team_clean.lower() and len(team_name_clean) >= 5
+            )
+            
+            if home_match or away_match:
+                matched_team = team
+                matched_teams.add(team.name)
+                break
+        
+        # If matched, create/update fixture for that team
+        if matched_team:
+            fixture = create_or_update_fixture(session, org_id, str(matched_team.id), fixture_data)
+            if fixture:
+                # Check if fixture has tasks, create if missing
+                from models import Task
+                existing_task = session.query(Task).filter_by(
+                    fixture_id=fixture.id
+                ).first()
+                
+                if not existing_task:
+                    # Create task for this fixture
+                    task_type = 'home_email' if fixture.home_away == 'Home' else 'away_email'
+                    task_status = 'pending' if fixture.home_away == 'Home' else 'waiting'
+                    
+                    new_task = Task(
+                        organization_id=UUID(org_id),
+                        fixture_id=fixture.id,
+                        task_type=task_type,
+                        status=task_status
+                    )
+                    session.add(new_task)
+                    logger.debug(f"Created task for fixture {fixture.id}")
+                
+                if fixture.created_at == fixture.updated_at:
+                    result['fixtures_imported'] += 1
+    
+    result['teams_matched'] = sorted(list(matched_teams))
+    return True
+
+
 def refresh_club_fixtures(organization: Organization, club_url: str, headless: bool = True) -> dict:
     """
     Refresh fixtures from a club-wide URL and match them to managed teams
@@ -500,7 +617,6 @@ def refresh_club_fixtures(organization: Organization, club_url: str, headless: b
             result['error'] = "No fixtures found on page"
             return result
         
-        # Get all managed teams for this organization
         database_url = os.environ.get('DATABASE_URL')
         if not database_url:
             raise ValueError("DATABASE_URL environment variable is required")
@@ -509,118 +625,17 @@ def refresh_club_fixtures(organization: Organization, club_url: str, headless: b
         session = db_manager.get_session()
         
         try:
-            managed_teams = session.query(Team).filter_by(
-                organization_id=organization.id,
-                is_managed=True
-            ).all()
-            
-            logger.info(f"Found {len(managed_teams)} managed teams to match against")
-            
-            if not managed_teams:
-                result['error'] = "No managed teams found"
-                return result
-            
-            org_id = str(organization.id)
-            
-            # Helper function to extract team identifier
-            def extract_team_identifier(name):
-                if not name:
-                    return ""
-                match = re.search(r'(U\d+\s*(?:Black|White|Red|Blue|Green)?)', name, re.IGNORECASE)
-                if match:
-                    return match.group(1).strip().lower()
-                return name.lower()
-            
-            def clean_team_name(name):
-                if not name:
-                    return ""
-                name = name.strip()
-                name = re.sub(r'^Withdean\s+Youth\s+', '', name, flags=re.IGNORECASE)
-                name = re.sub(r'^Withdean\s+', '', name, flags=re.IGNORECASE)
-                parts = re.split(r'\s{2,}', name)
-                if parts:
-                    name = parts[0].strip()
-                return name.strip()
-            
-            # Match each fixture to a managed team
-            matched_teams = set()
-            
-            for fixture_data in scraped_fixtures:
-                home_team = fixture_data.get('home_team', '').strip()
-                away_team = fixture_data.get('away_team', '').strip()
-                
-                # Try to match against each managed team
-                matched_team = None
-                
-                for team in managed_teams:
-                    team_name_clean = clean_team_name(team.name)
-                    team_id = extract_team_identifier(team.name)
-                    
-                    home_team_clean = clean_team_name(home_team)
-                    away_team_clean = clean_team_name(away_team)
-                    
-                    home_id = extract_team_identifier(home_team)
-                    away_id = extract_team_identifier(away_team)
-                    
-                    # Check if managed team matches home or away team
-                    home_match = (
-                        team_id == home_id if (team_id and home_id) else False
-                    ) or (
-                        team_name_clean.lower() == home_team_clean.lower()
-                    ) or (
-                        team_name_clean.lower() in home_team_clean.lower() and len(team_name_clean) >= 5
-                    )
-                    
-                    away_match = (
-                        team_id == away_id if (team_id and away_id) else False
-                    ) or (
-                        team_name_clean.lower() == away_team_clean.lower()
-                    ) or (
-                        team_name_clean.lower() in away_team_clean.lower() and len(team_name_clean) >= 5
-                    )
-                    
-                    if home_match or away_match:
-                        matched_team = team
-                        matched_teams.add(team.name)
-                        break
-                
-                # If matched, create/update fixture for that team
-                if matched_team:
-                    fixture = create_or_update_fixture(session, org_id, str(matched_team.id), fixture_data)
-                    if fixture:
-                        # Check if fixture has tasks, create if missing
-                        from models import Task
-                        existing_task = session.query(Task).filter_by(
-                            fixture_id=fixture.id
-                        ).first()
-                        
-                        if not existing_task:
-                            # Create task for this fixture
-                            task_type = 'home_email' if fixture.home_away == 'Home' else 'away_email'
-                            task_status = 'pending' if fixture.home_away == 'Home' else 'waiting'
-                            
-                            new_task = Task(
-                                organization_id=UUID(org_id),
-                                fixture_id=fixture.id,
-                                task_type=task_type,
-                                status=task_status
-                            )
-                            session.add(new_task)
-                            logger.debug(f"Created task for fixture {fixture.id}")
-                        
-                        if fixture.created_at == fixture.updated_at:
-                            result['fixtures_imported'] += 1
-            
+            saved = save_club_fixtures(session, organization, scraped_fixtures, result)
             session.commit()
-            result['teams_matched'] = sorted(list(matched_teams))
-            result['success'] = True
-            logger.info(f"Successfully imported {result['fixtures_imported']} fixtures for {len(matched_teams)} teams")
-            
         except Exception as e:
             session.rollback()
             raise
         finally:
             session.close()
+        
+        if saved:
+            result['success'] = True
+            logger.info(f"Successfully imported {result['fixtures_imported']} fixtures for {len(result['teams_matched'])} teams")
             
     except Exception as e:
         result['error'] = str(e)
@@ -2,18 +2,25 @@
 from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify
 from flask_login import login_required, current_user
 from datetime import datetime, timezone, timedelta
-import os
-import tempfile
 import io
 import csv
 import logging
 import re
-import pandas as pd
+import string
+from itertools import chain, islice, zip_longest
+import uuid
+from dataclasses import dataclass
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+from sqlalchemy import func, insert, literal, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm.attributes import flag_modified
 from werkzeug.utils import secure_filename
 
 from database import db_manager
 from utils import get_user_organization, allowed_file
-from models import Team, Pitch, Fixture, Task, TeamCoach, get_or_create_team
+from models import Team, Pitch, Fixture, Task, TeamCoach, TeamContact, PendingUpload, get_or_create_teams
 
 # Local imports
 from fixture_parser import FixtureParser
@@ -28,6 +35,116 @@ logger = logging.getLogger(__name__)
 
 imports_bp = Blueprint('imports', __name__)
 
+# Rows per chunk for the bulk fixture and team writes, keeping statements
+# and IN lists under the bind parameter limit
+UPSERT_CHUNK_SIZE = 1000
+
+# Buffered rows written (and committed) at a time by contact imports
+CONTACT_IMPORT_BATCH_SIZE = 5000
+
+# Per-fixture fields posted by the refresh review form, e.g. fixture_3_pitch_id
+_FIXTURE_FIELD_RE = re.compile(r'fixture_(\d+)_(data|import|pitch_id|save_alias|sheet_pitch)$')
+
+# Workbook sheets that never hold team or contact rows
+_SKIP_SHEET_RE = re.compile(r'template|summary|pivot|readme', re.IGNORECASE)
+
+# Contact workbook columns that are filled down across merged rows
+_FILL_DOWN_HEADER_RE = re.compile(r'club|team|name|contact|role|position|title|secretary|email|phone|mobile', re.IGNORECASE)
+
+# Roles mentioning both "secretary" and "fix", e.g. "Fixtures Secretary"
+_FIXTURE_SEC_RE = re.compile(r'(?=.*secretary)(?=.*fix)', re.IGNORECASE | re.DOTALL)
+
+# Header names that mark the role column in contact workbooks
+_ROLE_HEADER_RE = re.compile(r'role|position|title', re.IGNORECASE)
+
+# Team CSV header classes, tried in order from the start of the header, and
+# the field and confidence each one suggests
+_TEAM_HEADER_RE = re.compile(
+    r'(?P<team_and_name>(?=.*team)(?=.*name))'
+    r'|(?P<team>(?=.*team)|name$)'
+    r'|(?P<age_group>(?=.*(?:age|group)))',
+    re.IGNORECASE | re.DOTALL
+)
+_TEAM_HEADER_SUGGESTIONS = {
+    'team_and_name': ('team_name', 95),
+    'team': ('team_name', 85),
+    'age_group': ('age_group', 90),
+}
+
+# Header name patterns analyze_csv_columns matches against, per upload type
+_COLUMN_FIELD_PATTERNS = {
+    'contacts': {
+        'team_name': ['team_name', 'team', 'team name', 'club', 'club_name', 'squad', 'opposition', 'opposing team'],
+        'contact_name': ['contact_name', 'contact', 'name', 'manager', 'full_name', 'fullname', 'contact person'],
+        'email': ['email', 'email_address', 'e-mail', 'mail', 'contact_email'],
+        'phone': ['phone', 'phone_number', 'mobile', 'cell', 'telephone', 'contact_number'],
+        'role': ['role', 'position', 'title', 'job_title', 'responsibility'],
+        'notes': ['notes', 'comments', 'description', 'additional_info', 'remarks']
+    },
+    'coaches': {
+        'team_name': ['team_name', 'team', 'team name', 'club', 'club_name', 'squad'],
+        'coach_name': ['coach_name', 'coach', 'name', 'coach name', 'full_name', 'fullname', 'manager'],
+        'email': ['email', 'email_address', 'e-mail', 'mail', 'contact_email'],
+        'phone': ['phone', 'phone_number', 'mobile', 'cell', 'telephone', 'contact_number'],
+        'role': ['role', 'position', 'title', 'job_title', 'coach_role'],
+        'notes': ['notes', 'comments', 'description', 'additional_info', 'remarks']
+    },
+}
+
+# How long store_pending_csv keeps an abandoned upload's CSV text
+_PENDING_CSV_MAX_AGE = timedelta(hours=1)
+
+# Delimiters sniff_csv_delimiter chooses between for uploaded or pasted CSV text
+_CSV_DELIMITERS = ',;\t'
+
+# Exact header -> field lookups for the patterns above; built in reverse so
+# the first field listing a pattern wins
+_COLUMN_EXACT_FIELDS = {
+    mode: {pattern: field for field, patterns in reversed(field_patterns.items()) for pattern in patterns}
+    for mode, field_patterns in _COLUMN_FIELD_PATTERNS.items()
+}
+
+# Partial header matchers for the patterns above, in field order: a regex
+# finding any pattern inside a header, and the patterns joined with NULs for
+# finding a header inside any pattern, so each field is one check per side
+_COLUMN_PARTIAL_MATCHERS = {
+    mode: [
+        (field, re.compile('|'.join(map(re.escape, patterns))), '\0'.join(patterns))
+        for field, patterns in field_patterns.items()
+    ]
+    for mode, field_patterns in _COLUMN_FIELD_PATTERNS.items()
+}
+
+# Column content patterns used by _analyze_column_content to spot email and
+# phone columns
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_RE = re.compile(r'''
+    \b\d{11}\b                   # 07123456789
+  | \b\d{3}\s?\d{4}\s?\d{4}\b    # 071 2345 6789
+  | \b\+44\s?\d{10}\b            # +44 7123456789
+  | \b0\d{4}\s?\d{6}\b           # 01234 567890 (landline)
+  | \b\(\d{4}\)\s?\d{6}\b        # (01234) 567890
+''', re.VERBOSE)
+
+# Tabs and line breaks inside CSV cells (e.g. quoted multi-line cells) become
+# spaces, so team names and age groups stay on one line
+_CELL_WHITESPACE = str.maketrans('\t\r\n', '   ')
+
+# Patterns and formats used by parse_flexible_date, compiled once at import time.
+# The standard formats are grouped by the separators a date must contain to
+# match them, so each date is only tried against the formats it could fit
+_ISO_DATE_PREFIX_RE = re.compile(r'\d{4}-')
+_ISO_DATE_FORMATS = ('%Y-%m-%d',)
+_SLASH_DATE_FORMATS = ('%d/%m/%Y', '%m/%d/%Y')
+_DASH_DATE_FORMATS = ('%d-%m-%Y',)
+_DAY_MONTH_FORMATS = ('%d %b %Y', '%d %B %Y')
+_DAY_ABBREVS = frozenset({'mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun'})
+_HA_MAP = {'home': 'Home', 'h': 'Home', 'away': 'Away', 'a': 'Away'}
+_ORDINAL_RE = re.compile(r'(\d+)(?:st|nd|rd|th)', re.IGNORECASE)
+
+# CoachCsvRow fields a column mapping can fill
+_COACH_CSV_FIELDS = frozenset(('team_name', 'coach_name', 'email', 'phone', 'role', 'notes'))
+
 # Helper to get the next Sunday's date
 def get_next_sunday():
     today = datetime.now().date()
@@ -79,35 +196,122 @@ def convert_generic_fixtures_to_csv(fixtures):
         writer.writerow(f)
     return output.getvalue()
 
-def _analyze_column_content(column_name, sample_rows):
+def mapping_from_form(form):
+    """Collect the {csv_column: field} choices posted as mapping_<csv_column> fields"""
+    return {key[8:]: value for key, value in form.items() if value and key.startswith('mapping_')}
+
+def store_pending_csv(session, csv_data):
     """
-    Analyze column content to detect email/phone patterns
-    Returns tuple of (field_type, confidence_score) or None
+    Save uploaded CSV text in the pending_uploads table for the mapping and
+    confirm steps, and return the token the forms post back instead of the CSV.
+    Rows left behind by abandoned uploads are removed once they expire. Returns
+    None if the CSV could not be saved, in which case the forms carry the CSV
+    text itself.
     """
-    email_pattern = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
-    phone_patterns = [
-        re.compile(r'\b\d{11}\b'),  # 07123456789
-        re.compile(r'\b\d{3}\s?\d{4}\s?\d{4}\b'),  # 071 2345 6789
-        re.compile(r'\b\+44\s?\d{10}\b'),  # +44 7123456789
-        re.compile(r'\b0\d{4}\s?\d{6}\b'),  # 01234 567890 (landline)
-        re.compile(r'\b\(\d{4}\)\s?\d{6}\b'),  # (01234) 567890
+    try:
+        expired = datetime.now(timezone.utc) - _PENDING_CSV_MAX_AGE
+        session.query(PendingUpload).filter(
+            PendingUpload.created_at < expired
+        ).delete(synchronize_session=False)
+
+        pending = PendingUpload(user_id=current_user.id, csv_data=csv_data)
+        session.add(pending)
+        session.commit()
+        return str(pending.id)
+    except SQLAlchemyError:
+        session.rollback()
+        logger.warning("Could not save pending CSV upload", exc_info=True)
+        return None
+
+def _pending_upload(session, form):
+    """The current user's PendingUpload named by a posted csv_token, or None"""
+    try:
+        token = uuid.UUID(form.get('csv_token', ''))
+    except ValueError:
+        return None
+    return session.query(PendingUpload).filter_by(id=token, user_id=current_user.id).first()
+
+def load_pending_csv(session, form):
+    """Return the CSV text a step posted, from the upload named by its csv_token or else its csv_data field"""
+    pending = _pending_upload(session, form)
+    if pending:
+        return pending.csv_data
+    return form.get('csv_data', '')
+
+def discard_pending_csv(session, form):
+    """Remove the pending upload named by a posted csv_token, if any"""
+    pending = _pending_upload(session, form)
+    if pending:
+        session.delete(pending)
+        session.commit()
+
+def sniff_csv_delimiter(csv_data):
+    """
+    Detect whether CSV text is comma, semicolon or tab separated (e.g. data
+    pasted from a spreadsheet) from its leading lines, defaulting to commas
+    """
+    try:
+        return csv.Sniffer().sniff(csv_sample(csv_data, 4096), delimiters=_CSV_DELIMITERS).delimiter
+    except csv.Error:
+        return ','
+
+def open_csv_rows(csv_data):
+    """
+    Return (headers, rows) for CSV text or an open text stream, where rows
+    lazily yields each non-blank row as a list of cells.
+    Rows are read lazily, so callers that stop early only parse what they use.
+    """
+    delimiter = ','
+    if isinstance(csv_data, str):
+        csv_data = csv_data.strip()
+        delimiter = sniff_csv_delimiter(csv_data)
+        csv_data = io.StringIO(csv_data)
+    rows = (row for row in csv.reader(csv_data, delimiter=delimiter) if row)
+    return next(rows, []), rows
+
+def mapped_columns(headers, column_mapping):
+    """
+    Resolve a {csv_column: field} mapping to (column index, field) pairs,
+    skipping columns the CSV does not have. A repeated header uses its last
+    column, as csv.DictReader would.
+    """
+    column_index = {header: index for index, header in enumerate(headers)}
+    return [
+        (column_index[csv_header], our_field)
+        for csv_header, our_field in column_mapping.items()
+        if csv_header in column_index
     ]
 
+def csv_sample(csv_data, size=65536):
+    """
+    Return the leading complete lines of CSV text, up to size characters,
+    for column analysis that only needs the header and a few rows.
+    """
+    if len(csv_data) <= size:
+        return csv_data
+    sample = csv_data[:size]
+    cut = sample.rfind('\n')
+    return sample[:cut] if cut > 0 else csv_data
+
+def _analyze_column_content(values):
+    """
+    Analyze a column's stripped sample values to detect email/phone patterns
+    Returns tuple of (field_type, confidence_score) or None
+    """
     email_count = 0
     phone_count = 0
     total_values = 0
 
-    for row in sample_rows:
-        value = str(row.get(column_name, '')).strip()
+    for value in values:
         if value:
             total_values += 1
 
-            # Check for email pattern
-            if email_pattern.search(value):
+            # Check for email pattern, only for values that could be one
+            if '@' in value and _EMAIL_RE.search(value):
                 email_count += 1
 
             # Check for phone patterns
-            elif any(pattern.search(value) for pattern in phone_patterns):
+            elif _PHONE_RE.search(value):
                 phone_count += 1
 
     if total_values == 0:
@@ -126,115 +330,20 @@ def _analyze_column_content(column_name, sample_rows):
 
 def analyze_csv_columns(csv_data, mode='coaches'):
     """
-    Analyze CSV columns and attempt to map them to expected fields
+    Analyze CSV columns and attempt to map them to expected fields.
 
     Returns:
         dict with analysis results including suggested mappings
     """
     try:
-        csv_file = io.StringIO(csv_data.strip())
-        reader = csv.DictReader(csv_file)
-
-        # Get the headers from the CSV
-        headers = list(reader.fieldnames) if reader.fieldnames else []
-
-        # Read first few rows to get sample data
-        sample_rows = []
-        for i, row in enumerate(reader):
-            if i >= 3:  # Only get first 3 rows for preview
-                break
-            sample_rows.append(row)
-
-        # Define mapping patterns for automatic detection
-        if mode == 'contacts':
-            field_patterns = {
-                'team_name': ['team_name', 'team', 'team name', 'club', 'club_name', 'squad', 'opposition', 'opposing team'],
-                'contact_name': ['contact_name', 'contact', 'name', 'manager', 'full_name', 'fullname', 'contact person'],
-                'email': ['email', 'email_address', 'e-mail', 'mail', 'contact_email'],
-                'phone': ['phone', 'phone_number', 'mobile', 'cell', 'telephone', 'contact_number'],
-                'role': ['role', 'position', 'title', 'job_title', 'responsibility'],
-                'notes': ['notes', 'comments', 'description', 'additional_info', 'remarks']
-            }
-        else:
-            # Default to coaches
-            field_patterns = {
-                'team_name': ['team_name', 'team', 'team name', 'club', 'club_name', 'squad'],
-                'coach_name': ['coach_name', 'coach', 'name', 'coach name', 'full_name', 'fullname', 'manager'],
-                'email': ['email', 'email_address', 'e-mail', 'mail', 'contact_email'],
-                'phone': ['phone', 'phone_number', 'mobile', 'cell', 'telephone', 'contact_number'],
-                'role': ['role', 'position', 'title', 'job_title', 'coach_role'],
-                'notes': ['notes', 'comments', 'description', 'additional_info', 'remarks']
-            }
+        # Only the header and first few rows are needed, so parse just the
+        # leading lines rather than the whole upload
+        headers, rows = open_csv_rows(csv_sample(csv_data))
 
-        # Attempt automatic mapping
-        suggested_mapping = {}
-        confidence_scores = {}
-
-        for header in headers:
-            header_lower = header.lower().strip()
-            best_match = None
-            best_score = 0
-
-            # First try header name matching
-            for field, patterns in field_patterns.items():
-                for pattern in patterns:
-                    if pattern == header_lower:
-                        # Exact match
-                        score = 100
-                    elif pattern in header_lower or header_lower in pattern:
-                        # Partial match
-                        score = 70
-                    else:
-                        continue
-
-                    if score > best_score:
-                        best_score = score
-                        best_match = field
-
-            # If no good header match, try content pattern matching for email/phone
-            if best_score < 90 and sample_rows:
-                content_scores = _analyze_column_content(header, sample_rows)
-                if content_scores:
-                    field, score = content_scores
-                    if score > best_score:
-                        best_score = score
-                        best_match = field
-
-            # Specific check for 'role' if not already mapped with high confidence
-            if not best_match or best_score < 90:
-                if 'role' in header_lower or 'position' in header_lower or 'title' in header_lower:
-                    if best_match != 'role' or best_score < 80: # Only override if current best match isn't role or confidence is low
-                        best_match = 'role'
-                        best_score = max(best_score, 80) # Give a decent score for role detection
-
-            if best_match and best_score >= 70:
-                suggested_mapping[header] = best_match
-                confidence_scores[header] = best_score
-
-        # Check if we have the required fields
-        mapped_fields = set(suggested_mapping.values())
-        if mode == 'contacts':
-            required_fields = {'team_name', 'contact_name'}
-        else:
-            required_fields = {'team_name', 'coach_name'}
-        has_required = required_fields.issubset(mapped_fields)
-
-        # Calculate overall confidence
-        if suggested_mapping:
-            avg_confidence = sum(confidence_scores.values()) / len(confidence_scores)
-        else:
-            avg_confidence = 0
+        # Read first few rows to get sample data, leaving the rest unread
+        sample_rows = [dict(zip(headers, row)) for row in islice(rows, 3)]
 
-        return {
-            'headers': headers,
-            'sample_rows': sample_rows,
-            'suggested_mapping': suggested_mapping,
-            'confidence_scores': confidence_scores,
-            'has_required_fields': has_required,
-            'missing_required': required_fields - mapped_fields,
-            'overall_confidence': avg_confidence,
-            'needs_manual_mapping': not has_required or avg_confidence < 80
-        }
+        return suggest_column_mapping(headers, sample_rows, mode)
 
     except Exception as e:
         return {
@@ -242,6 +351,83 @@ def analyze_csv_columns(csv_data, mode='coaches'):
             'needs_manual_mapping': True
         }
 
+def suggest_column_mapping(headers, sample_rows, mode='coaches'):
+    """
+    Suggest a field for each CSV header from its name, or from the sample
+    rows' content for email/phone columns. Returns the analysis dict used by
+    the mapping step.
+    """
+    # Mapping patterns for automatic detection, defaulting to coaches
+    if mode != 'contacts':
+        mode = 'coaches'
+    exact_fields = _COLUMN_EXACT_FIELDS[mode]
+    partial_matchers = _COLUMN_PARTIAL_MATCHERS[mode]
+
+    # Attempt automatic mapping
+    suggested_mapping = {}
+    confidence_scores = {}
+    score_total = 0
+    scored_columns = 0
+
+    for header in headers:
+        header_lower = header.lower().strip()
+
+        # First try header name matching: exact match, else the first
+        # field with a partial match
+        best_match = exact_fields.get(header_lower)
+        best_score = 100 if best_match else 0
+        if not best_match:
+            for field, pattern_re, joined_patterns in partial_matchers:
+                if pattern_re.search(header_lower) or header_lower in joined_patterns:
+                    best_match = field
+                    best_score = 70
+                    break
+
+        # If no good header match, try content pattern matching for email/phone
+        if best_score < 90 and sample_rows:
+            column_values = [row.get(header, '').strip() for row in sample_rows]
+            content_scores = _analyze_column_content(column_values)
+            if content_scores:
+                field, score = content_scores
+                if score > best_score:
+                    best_score = score
+                    best_match = field
+
+        # Specific check for 'role' if not already mapped with high confidence
+        if not best_match or best_score < 90:
+            if 'role' in header_lower or 'position' in header_lower or 'title' in header_lower:
+                if best_match != 'role' or best_score < 80: # Only override if current best match isn't role or confidence is low
+                    best_match = 'role'
+                    best_score = max(best_score, 80) # Give a decent score for role detection
+
+        if best_match and best_score >= 70:
+            suggested_mapping[header] = best_match
+            confidence_scores[header] = best_score
+            score_total += best_score
+            scored_columns += 1
+
+    # Check if we have the required fields
+    mapped_fields = set(suggested_mapping.values())
+    if mode == 'contacts':
+        required_fields = {'team_name', 'contact_name'}
+    else:
+        required_fields = {'team_name', 'coach_name'}
+    has_required = required_fields.issubset(mapped_fields)
+
+    # Calculate overall confidence from the running total
+    avg_confidence = score_total / scored_columns if scored_columns else 0
+
+    return {
+        'headers': headers,
+        'sample_rows': sample_rows,
+        'suggested_mapping': suggested_mapping,
+        'confidence_scores': confidence_scores,
+        'has_required_fields': has_required,
+        'missing_required': required_fields - mapped_fields,
+        'overall_confidence': avg_confidence,
+        'needs_manual_mapping': not has_required or avg_confidence < 80
+    }
+
 def process_coach_csv(session, organization_id, csv_data, update_existing=False, column_mapping=None, selected_indices=None):
     """
     Process CSV data for bulk coach upload
@@ -266,31 +452,50 @@ def process_coach_csv(session, organization_id, csv_data, update_existing=False,
 
     try:
         # Parse CSV data
-        csv_file = io.StringIO(csv_data.strip())
-        reader = csv.DictReader(csv_file)
+        headers, rows = open_csv_rows(csv_data)
 
         # If no column mapping provided, try automatic detection
         if column_mapping is None:
-            analysis = analyze_csv_columns(csv_data)
+            sample = list(islice(rows, 3))
+            analysis = suggest_column_mapping(headers, [dict(zip(headers, row)) for row in sample])
             if analysis.get('needs_manual_mapping'):
                 result['needs_mapping'] = True
                 result['analysis'] = analysis
                 return result
             column_mapping = analysis['suggested_mapping']
+            # Continue with the rows the analysis sampled
+            rows = chain(sample, rows)
 
-        # Create reverse mapping (original_header -> our_field)
-        reverse_mapping = {v: k for k, v in column_mapping.items()}
+        # Resolve the mapping to column positions once, rather than looking
+        # up each header per row
+        field_columns = mapped_columns(headers, column_mapping)
 
-        # Get all teams for this organization for lookup
-        teams = session.query(Team).filter_by(organization_id=organization_id).all()
-        team_lookup = {team.name.lower().strip(): team for team in teams}
+        # Get all team ids and names for this organization for lookup
+        team_lookup = {
+            name.lower().strip(): (team_id, name)
+            for team_id, name in session.query(Team.id, Team.name).filter_by(organization_id=organization_id)
+        }
+        # Lookup results by team name as written in the CSV
+        teams_by_name = {}
+
+        # Load existing coach ids once, keyed by team and coach name
+        coach_ids = {
+            (team_id, coach_name): coach_id
+            for coach_id, team_id, coach_name in session.query(
+                TeamCoach.id, TeamCoach.team_id, TeamCoach.coach_name
+            ).filter_by(organization_id=organization_id)
+        }
+        new_coaches = {}
+        updated_coaches = {}
+        now = datetime.utcnow()
 
         # Track which teams are referenced
         referenced_teams = set()
 
-        # Process each row
-        # Convert reader to list to handle indexing if needed
-        rows = list(reader)
+        if selected_indices is not None:
+            selected_indices = set(selected_indices)
+
+        # Process each row as it is read
         for row_num, row in enumerate(rows):
             actual_row_num = row_num + 2 # 1-based + header
             
@@ -308,8 +513,8 @@ def process_coach_csv(session, organization_id, csv_data, update_existing=False,
                 notes = None
 
                 # Map the fields from the row using our column mapping
-                for csv_header, our_field in column_mapping.items():
-                    value = row.get(csv_header, '').strip()
+                for column, our_field in field_columns:
+                    value = row[column].strip() if column < len(row) else ''
                     if our_field == 'team_name':
                         team_name = value
                     elif our_field == 'coach_name':
@@ -330,9 +535,10 @@ def process_coach_csv(session, organization_id, csv_data, update_existing=False,
                     })
                     continue
 
-                # Find team
-                team_key = team_name.lower().strip()
-                team = team_lookup.get(team_key)
+                # Find team, normalising each distinct team name only once
+                if team_name not in teams_by_name:
+                    teams_by_name[team_name] = team_lookup.get(team_name.lower())
+                team = teams_by_name[team_name]
 
                 if not team:
                     result['errors'].append({
@@ -341,23 +547,30 @@ def process_coach_csv(session, organization_id, csv_data, update_existing=False,
                     })
                     continue
 
-                referenced_teams.add(team.name)
+                team_id, team_display_name = team
+                referenced_teams.add(team_display_name)
 
-                # Check if coach already exists for this team
-                existing_coach = session.query(TeamCoach).filter_by(
-                    organization_id=organization_id,
-                    team_id=team.id,
-                    coach_name=coach_name
-                ).first()
+                # Check if coach already exists for this team, or was added
+                # earlier in this file
+                coach_key = (team_id, coach_name)
+                existing_id = coach_ids.get(coach_key)
+                pending_coach = new_coaches.get(coach_key)
 
-                if existing_coach:
+                if existing_id or pending_coach:
                     if update_existing:
-                        # Update existing coach
-                        existing_coach.email = email
-                        existing_coach.phone = phone
-                        existing_coach.role = role
-                        existing_coach.notes = notes
-                        existing_coach.updated_at = datetime.utcnow()
+                        # Update existing coach; updates to saved coaches are
+                        # written together after the loop
+                        if pending_coach:
+                            pending_coach.update(email=email, phone=phone, role=role, notes=notes)
+                        else:
+                            updated_coaches[existing_id] = {
+                                'id': existing_id,
+                                'email': email,
+                                'phone': phone,
+                                'role': role,
+                                'notes': notes,
+                                'updated_at': now
+                            }
                         result['updated'] += 1
                     else:
                         result['errors'].append({
@@ -366,19 +579,19 @@ def process_coach_csv(session, organization_id, csv_data, update_existing=False,
                         })
                         continue
                 else:
-                    # Create new coach
-                    new_coach = TeamCoach(
-                        organization_id=organization_id,
-                        team_id=team.id,
-                        coach_name=coach_name,
-                        email=email,
-                        phone=phone,
-                        role=role,
-                        notes=notes,
-                        created_at=datetime.utcnow(),
-                        updated_at=datetime.utcnow()
-                    )
-                    session.add(new_coach)
+                    # Create new coach; new coaches are inserted together
+                    # after the loop
+                    new_coaches[coach_key] = {
+                        'organization_id': organization_id,
+                        'team_id': team_id,
+                        'coach_name': coach_name,
+                        'email': email,
+                        'phone': phone,
+                        'role': role,
+                        'notes': notes,
+                        'created_at': now,
+                        'updated_at': now
+                    }
                     result['created'] += 1
 
             except Exception as e:
@@ -389,6 +602,11 @@ def process_coach_csv(session, organization_id, csv_data, update_existing=False,
                 continue
 
         # Commit changes
+        if new_coaches:
+            # render_nulls keeps rows with blank optional fields in one batch
+            session.execute(insert(TeamCoach).execution_options(render_nulls=True), list(new_coaches.values()))
+        if updated_coaches:
+            session.execute(update(TeamCoach), list(updated_coaches.values()))
         session.commit()
 
         # Set success message
@@ -408,6 +626,17 @@ def process_coach_csv(session, organization_id, csv_data, update_existing=False,
 
     return result
 
+@dataclass(slots=True)
+class CoachCsvRow:
+    """A coach parsed from a CSV upload for the preview"""
+    row_num: int
+    team_name: str = ''
+    coach_name: str = ''
+    email: str = ''
+    phone: str = ''
+    role: str = 'Coach'
+    notes: str = ''
+
 def preview_coach_csv(csv_data, column_mapping):
     """
     Preview CSV data without saving - for confirmation step
@@ -415,46 +644,39 @@ def preview_coach_csv(csv_data, column_mapping):
     """
     preview_data = {
         'coaches': [],
-        'teams': set(),
+        'teams': {},
         'total_rows': 0,
         'errors': []
     }
 
     try:
-        csv_file = io.StringIO(csv_data.strip())
-        reader = csv.DictReader(csv_file)
+        headers, rows = open_csv_rows(csv_data)
+        field_columns = [
+            (column, our_field) for column, our_field in mapped_columns(headers, column_mapping)
+            if our_field in _COACH_CSV_FIELDS
+        ]
 
-        for row_num, row in enumerate(reader, start=2):
+        for row_num, row in enumerate(rows, start=2):
             preview_data['total_rows'] += 1
 
-            # Extract fields using column mapping
-            coach_data = {
-                'row_num': row_num,
-                'team_name': '',
-                'coach_name': '',
-                'email': '',
-                'phone': '',
-                'role': 'Coach',
-                'notes': ''
-            }
-
-            # Map the fields from the row
-            for csv_header, our_field in column_mapping.items():
-                value = row.get(csv_header, '').strip()
-                if our_field in coach_data:
-                    coach_data[our_field] = value or coach_data[our_field]
+            # Map the fields from the row, keeping defaults for blank cells
+            coach = CoachCsvRow(row_num)
+            for column, our_field in field_columns:
+                value = row[column].strip() if column < len(row) else ''
+                if value:
+                    setattr(coach, our_field, value)
 
             # Validate required fields
-            if not coach_data['team_name'] or not coach_data['coach_name']:
+            if not coach.team_name or not coach.coach_name:
                 preview_data['errors'].append({
                     'row': row_num,
                     'message': 'Missing required fields: team_name and coach_name are required',
-                    'data': coach_data
+                    'data': coach
                 })
                 continue
 
-            preview_data['coaches'].append(coach_data)
-            preview_data['teams'].add(coach_data['team_name'])
+            preview_data['coaches'].append(coach)
+            preview_data['teams'][coach.team_name] = None
 
     except Exception as e:
         preview_data['errors'].append({
@@ -463,8 +685,8 @@ def preview_coach_csv(csv_data, column_mapping):
             'data': {}
         })
 
-    # Convert set to sorted list
-    preview_data['teams'] = sorted(list(preview_data['teams']))
+    # Convert the ordered set of team names to a sorted list
+    preview_data['teams'] = sorted(preview_data['teams'])
 
     return preview_data
 
@@ -484,9 +706,9 @@ def process_team_contact_csv(session, organization_id, csv_data, update_existing
     try:
         from models import TeamContact
         
-        # Parse CSV data
-        csv_file = io.StringIO(csv_data.strip())
-        reader = csv.DictReader(csv_file)
+        # Parse CSV data, split on the delimiter analyze_csv_columns detects
+        csv_data = csv_data.strip()
+        reader = csv.DictReader(io.StringIO(csv_data), delimiter=sniff_csv_delimiter(csv_data))
 
         # If no column mapping provided, try automatic detection
         if column_mapping is None:
@@ -604,8 +826,9 @@ def preview_contact_csv(csv_data, column_mapping):
     }
 
     try:
-        csv_file = io.StringIO(csv_data.strip())
-        reader = csv.DictReader(csv_file)
+        # Split on the delimiter analyze_csv_columns detected for the mapping
+        csv_data = csv_data.strip()
+        reader = csv.DictReader(io.StringIO(csv_data), delimiter=sniff_csv_delimiter(csv_data))
 
         for row_num, row in enumerate(reader, start=2):
             preview_data['total_rows'] += 1
@@ -621,7 +844,7 @@ def preview_contact_csv(csv_data, column_mapping):
             }
 
             for csv_header, our_field in column_mapping.items():
-                value = row.get(csv_header, '').strip()
+                value = (row.get(csv_header) or '').strip()
                 if our_field in contact_data:
                     contact_data[our_field] = value or contact_data[our_field]
 
@@ -648,7 +871,7 @@ def preview_contact_csv(csv_data, column_mapping):
 
     return preview_data
 
-def handle_manual_import(session, org, managed_team_names):
+def handle_manual_import(session, org, managed_teams_by_name):
     """Handle manual fixture entry"""
     manual_team = request.form.get('manual_team', '').strip()
     manual_opposition = request.form.get('manual_opposition', '').strip()
@@ -661,16 +884,6 @@ def handle_manual_import(session, org, managed_team_names):
         flash('Please fill in all required fields', 'error')
         return redirect(url_for('imports.import_fixtures'))
     
-    # Get team
-    team = session.query(Team).filter_by(
-        organization_id=org.id,
-        name=manual_team
-    ).first()
-    
-    if not team:
-        flash(f'Team "{manual_team}" not found', 'error')
-        return redirect(url_for('imports.import_fixtures'))
-    
     # Parse date
     try:
         if 'T' in manual_date:
@@ -686,13 +899,21 @@ def handle_manual_import(session, org, managed_team_names):
         flash(f'Invalid date format: {str(e)}', 'error')
         return redirect(url_for('imports.import_fixtures'))
     
-    # Get pitch if specified
-    pitch = None
+    # Get the team, and the pitch if specified, in one query
+    pitch_id = literal(None)
     if manual_pitch:
-        pitch = session.query(Pitch).filter_by(
-            organization_id=org.id,
-            name=manual_pitch
-        ).first()
+        pitch_id = select(Pitch.id).where(
+            Pitch.organization_id == org.id,
+            Pitch.name == manual_pitch
+        ).limit(1).scalar_subquery()
+    team = session.query(Team.id, pitch_id.label('pitch_id')).filter_by(
+        organization_id=org.id,
+        name=manual_team
+    ).first()
+    
+    if not team:
+        flash(f'Team "{manual_team}" not found', 'error')
+        return redirect(url_for('imports.import_fixtures'))
     
     # Create fixture
     fixture = Fixture(
@@ -702,7 +923,7 @@ def handle_manual_import(session, org, managed_team_names):
         home_away=manual_home_away,
         kickoff_datetime=kickoff_datetime,
         kickoff_time_text=manual_time,
-        pitch_id=pitch.id if pitch else None
+        pitch_id=team.pitch_id
     )
     session.add(fixture)
     session.flush()  # Get the fixture ID
@@ -722,7 +943,7 @@ def handle_manual_import(session, org, managed_team_names):
     flash(f'Fixture added successfully for {manual_team}!', 'success')
     return redirect(url_for('imports.import_fixtures'))
 
-def upload_file_internal(session, org, managed_team_names):
+def upload_file_internal(session, org, managed_teams_by_name):
     """Internal handler for CSV upload"""
     if 'file' not in request.files:
         flash('No file selected', 'error')
@@ -739,152 +960,92 @@ def upload_file_internal(session, org, managed_team_names):
     
     try:
         parser = FixtureParser()
-        file_content = file.read()
         
-        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file.filename)[1]) as temp_file:
-            temp_file.write(file_content)
-            temp_file_path = temp_file.name
+        # Read the upload stream directly rather than copying it to a temp file
+        df = parser.read_spreadsheet(file.stream, file.filename)
+        if df.empty:
+            flash('No data found in the uploaded file', 'error')
+            return redirect(url_for('imports.import_fixtures'))
         
-        try:
-            df = parser.read_spreadsheet(temp_file_path)
-            if df.empty:
-                flash('No data found in the uploaded file', 'error')
-                return redirect(url_for('imports.import_fixtures'))
-            
-            fixtures_data = parser.get_fixture_data(df)
-            
-            new_fixtures = 0
-            updated_fixtures = 0
-            new_tasks = 0
-            skipped_count = 0
-            
-            for fixture_data in fixtures_data:
-                try:
-                    team_name = fixture_data.get('team', '').strip() if fixture_data.get('team') else ''
-                    if not team_name:
-                        skipped_count += 1
-                        continue
-                    
-                    home_away_raw = fixture_data.get('home_away', '').strip() if fixture_data.get('home_away') else ''
-                    if not home_away_raw:
-                        skipped_count += 1
-                        continue
-                    
-                    # Normalize home_away
-                    if home_away_raw.lower() in ['home', 'h']:
-                        home_away = 'Home'
-                    elif home_away_raw.lower() in ['away', 'a']:
-                        home_away = 'Away'
-                    else:
-                        skipped_count += 1
-                        continue
-                    
-                    # Get or create team
-                    team = get_or_create_team(session, org.id, team_name)
-                    
-                    # Parse date - handle various formats
-                    fixture_date = fixture_data.get('date') or fixture_data.get('kickoff_datetime') or fixture_data.get('fixture_date')
-                    
-                    if not fixture_date:
-                        skipped_count += 1
-                        continue
-                    
-                    kickoff_datetime = None
-                    if isinstance(fixture_date, str):
-                        try:
-                            # Try ISO format
-                            if 'T' in fixture_date:
-                                kickoff_datetime = datetime.fromisoformat(fixture_date.replace('Z', '+00:00'))
-                            # Try date format
-                            else:
-                                # Common formats
-                                for fmt in ['%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y', '%d-%m-%Y']:
-                                    try:
-                                        kickoff_datetime = datetime.strptime(fixture_date, fmt).replace(tzinfo=timezone.utc)
-                                        break
-                                    except:
-                                        continue
-                                else:
-                                    skipped_count += 1
-                                    continue
-                        except:
-                            skipped_count += 1
-                            continue
-                    elif isinstance(fixture_date, datetime):
-                        kickoff_datetime = fixture_date
-                        if kickoff_datetime.tzinfo is None:
-                            kickoff_datetime = kickoff_datetime.replace(tzinfo=timezone.utc)
-                    else:
-                        skipped_count += 1
-                        continue
-                    
-                    # Check if fixture exists
-                    existing = session.query(Fixture).filter(
-                        Fixture.organization_id == org.id,
-                        Fixture.team_id == team.id,
-                        Fixture.kickoff_datetime == kickoff_datetime
-                    ).first()
-                    
-                    if existing:
-                        existing.opposition_name = fixture_data.get('opposition', existing.opposition_name) or 'TBC'
-                        existing.home_away = home_away
-                        existing.kickoff_time_text = fixture_data.get('time', existing.kickoff_time_text) or fixture_data.get('kickoff_time', 'TBC') or 'TBC'
-                        updated_fixtures += 1
-                        fixture = existing
-                    else:
-                        fixture = Fixture(
-                            organization_id=org.id,
-                            team_id=team.id,
-                            opposition_name=fixture_data.get('opposition', 'TBC') or 'TBC',
-                            home_away=home_away,
-                            kickoff_datetime=kickoff_datetime,
-                            kickoff_time_text=fixture_data.get('time', 'TBC') or fixture_data.get('kickoff_time', 'TBC') or 'TBC'
-                        )
-                        session.add(fixture)
-                        session.flush()
-                        new_fixtures += 1
-                    
-                    # Create task if doesn't exist
-                    existing_task = session.query(Task).filter_by(fixture_id=fixture.id).first()
-                    if not existing_task:
-                        task_type = 'home_email' if home_away == 'Home' else 'away_email'
-                        task_status = 'pending' if home_away == 'Home' else 'waiting'
-                        task = Task(
-                            organization_id=org.id,
-                            fixture_id=fixture.id,
-                            task_type=task_type,
-                            status=task_status
-                        )
-                        session.add(task)
-                        new_tasks += 1
-                    
-                except Exception as e:
-                    logger.warning(f"Error processing fixture data: {e}")
+        fixtures_data = parser.get_fixture_data(df)
+        
+        skipped_count = 0
+        duplicate_rows = 0
+        fixture_rows = {}
+        
+        # Resolve every distinct team with one lookup rather than once per row
+        team_names = {(fixture_data.get('team') or '').strip() for fixture_data in fixtures_data}
+        teams_by_name = dict(managed_teams_by_name)
+        teams_by_name.update(get_or_create_teams(session, org.id, team_names - teams_by_name.keys()))
+        
+        for fixture_data in fixtures_data:
+            try:
+                team_name = (fixture_data.get('team') or '').strip()
+                if not team_name:
                     skipped_count += 1
                     continue
-            
-            session.commit()
-            
-            flash_msg = f'Successfully imported {new_fixtures} new fixture(s)'
-            if updated_fixtures > 0:
-                flash_msg += f', updated {updated_fixtures} existing fixture(s)'
-            if skipped_count > 0:
-                flash_msg += f', skipped {skipped_count} fixture(s)'
-            flash(flash_msg + '!', 'success')
-            return redirect(url_for('imports.import_fixtures'))
-            
-        finally:
-            os.unlink(temp_file_path)
+                
+                # Normalize home_away
+                home_away, reason = resolve_home_away(fixture_data.get('home_away'))
+                if not home_away:
+                    logger.debug(f"Skipping uploaded fixture - {reason}")
+                    skipped_count += 1
+                    continue
+                
+                opposition = fixture_text(fixture_data, 'opposition')
+                time_text = fixture_text(fixture_data, 'time', 'kickoff_time')
+                
+                team = teams_by_name[team_name]
+                
+                # Parse date - handle various formats
+                kickoff_datetime, reason = parse_row_date(fixture_data)
+                if not kickoff_datetime:
+                    logger.debug(f"Skipping uploaded fixture - {reason}")
+                    skipped_count += 1
+                    continue
+                
+                # Queue the row for the upsert after the loop; a repeat of the
+                # same team/kickoff replaces the queued row
+                key = (team.id, kickoff_datetime)
+                if key in fixture_rows:
+                    duplicate_rows += 1
+                fixture_rows[key] = {
+                    'organization_id': org.id,
+                    'team_id': team.id,
+                    'opposition_name': opposition,
+                    'home_away': home_away,
+                    'kickoff_datetime': kickoff_datetime,
+                    'kickoff_time_text': time_text
+                }
+                
+            except Exception as e:
+                logger.warning(f"Error processing fixture data: {e}")
+                skipped_count += 1
+                continue
+        
+        new_fixtures, updated_fixtures, new_tasks = upsert_fixtures_with_tasks(
+            session, org.id, list(fixture_rows.values())
+        )
+        updated_fixtures += duplicate_rows
+        session.commit()
+        
+        flash_msg = f'Successfully imported {new_fixtures} new fixture(s)'
+        if updated_fixtures > 0:
+            flash_msg += f', updated {updated_fixtures} existing fixture(s)'
+        if skipped_count > 0:
+            flash_msg += f', skipped {skipped_count} fixture(s)'
+        flash(flash_msg + '!', 'success')
+        return redirect(url_for('imports.import_fixtures'))
             
     except Exception as e:
         flash(f'Error processing file: {str(e)}', 'error')
         return redirect(url_for('imports.import_fixtures'))
 
-def handle_csv_import(session, org, managed_team_names):
+def handle_csv_import(session, org, managed_teams_by_name):
     """Handle CSV/Excel file import"""
-    return upload_file_internal(session, org, managed_team_names)
+    return upload_file_internal(session, org, managed_teams_by_name)
 
-def handle_paste_import_internal(session, org, managed_team_names, fa_fixture_text):
+def handle_paste_import_internal(session, org, managed_teams_by_name, fa_fixture_text):
     """Handle pasted fixture data import, supporting FA format and generic tab-separated format.
     """
     fa_parser = FAFixtureParser()
@@ -918,32 +1079,16 @@ def handle_paste_import_internal(session, org, managed_team_names, fa_fixture_te
         flash(f'{error_count} fixture(s) could not be imported', 'warning')
     
     return redirect(url_for('imports.import_fixtures'))
-    """Handle pasted FA data import, with fallback for generic spreadsheet format.
+
+def normalize_kickoff(kickoff_datetime):
     """
-    fa_parser = FAFixtureParser()
-    parsed_fixtures = fa_parser.parse_fa_fixture_lines(fa_fixture_text)
-    
-    # If FA parser yields no fixtures, try generic spreadsheet parsing
-    if not parsed_fixtures:
-        # Attempt generic parsing of tab-separated lines
-        parsed_fixtures = parse_generic_spreadsheet_text(fa_fixture_text)
-    
-    if not parsed_fixtures:
-        flash('No valid fixtures found in the provided text', 'error')
-        return redirect(url_for('imports.import_fixtures'))
-    
-    csv_data = fa_parser.convert_to_standard_format(parsed_fixtures)
-    results = parse_fixture_text(csv_data, session, org)
-    
-    created_count = sum(1 for r in results if r.get('status') == 'success')
-    error_count = len(results) - created_count
-    
-    if created_count > 0:
-        flash(f'Successfully imported {created_count} fixture(s)!', 'success')
-    if error_count > 0:
-        flash(f'{error_count} fixture(s) could not be imported', 'warning')
-    
-    return redirect(url_for('imports.import_fixtures'))
+    Convert a kickoff datetime to UTC at whole-second precision so the same
+    kickoff always produces the same fixture lookup key.
+    Naive datetimes are taken to be UTC.
+    """
+    if kickoff_datetime.tzinfo is None:
+        kickoff_datetime = kickoff_datetime.replace(tzinfo=timezone.utc)
+    return kickoff_datetime.astimezone(timezone.utc).replace(microsecond=0)
 
 def parse_flexible_date(date_str):
     """
@@ -960,139 +1105,260 @@ def parse_flexible_date(date_str):
     # Try ISO format first
     if 'T' in date_str:
         try:
-            return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-        except:
+            return normalize_kickoff(datetime.fromisoformat(date_str.replace('Z', '+00:00')))
+        except ValueError:
             pass
 
-    # Try standard formats
-    for fmt in ['%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y', '%d-%m-%Y']:
+    # Try the standard formats the date's shape could match
+    if '/' in date_str:
+        formats = _SLASH_DATE_FORMATS
+    elif _ISO_DATE_PREFIX_RE.match(date_str):
+        formats = _ISO_DATE_FORMATS
+    elif '-' in date_str:
+        formats = _DASH_DATE_FORMATS
+    else:
+        formats = ()
+    for fmt in formats:
         try:
             return datetime.strptime(date_str, fmt).replace(tzinfo=timezone.utc)
-        except:
+        except ValueError:
             continue
             
     # Try "Sun 26th Nov" style
-    # Remove day name prefix if present (Sun, Mon, etc)
+    # Remove day name prefix if present (Sun, Mon, etc) - every day name starts
+    # with its 3-letter abbreviation, so check that and then drop the rest of
+    # the word ("Sunday", "Tues") along with any separators
     clean_date = date_str
-    days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday',
-            'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
-    
-    # Sort by length descending to match full names first
-    days.sort(key=len, reverse=True)
-    
-    for day in days:
-        if clean_date.lower().startswith(day.lower()):
-            clean_date = clean_date[len(day):].strip()
-            break
+    if date_str[:3].lower() in _DAY_ABBREVS:
+        clean_date = date_str[3:].lstrip(string.ascii_letters).lstrip(' ,.')
             
     # Remove ordinal suffixes (st, nd, rd, th)
     # Regex to replace 1st, 2nd, 3rd, 4th with 1, 2, 3, 4
     # But be careful not to break month names like August (though Aug is usually used)
     # Safer to just remove st, nd, rd, th if they follow a digit
-    clean_date = re.sub(r'(\d+)(st|nd|rd|th)', r'\1', clean_date)
+    clean_date = _ORDINAL_RE.sub(r'\1', clean_date)
     
     # Try parsing "26 Nov" or "26 November"
     # We need a year. If not present, assume current year or next occurrence?
     # Usually these sheets are for the current season.
     # Let's try adding current year
-    current_year = datetime.now().year
+    dated = f"{clean_date} {datetime.now().year}"
     
-    for fmt in ['%d %b', '%d %B']:
+    for fmt in _DAY_MONTH_FORMATS:
         try:
             # Parse with current year
-            dt = datetime.strptime(f"{clean_date} {current_year}", f"{fmt} %Y")
+            dt = datetime.strptime(dated, fmt)
             return dt.replace(tzinfo=timezone.utc)
-        except:
+        except ValueError:
             continue
             
     return None
 
-def process_sheet_fixtures(session, org, fixtures_data):
-    """Process fixtures from weekly sheet refresher"""
-    new_fixtures = 0
-    updated_fixtures = 0
-    new_tasks = 0
+def parse_row_date(fixture_data):
+    """
+    Get the kickoff datetime for an imported fixture row.
+    Returns (kickoff_datetime, None) or (None, reason) so callers can skip
+    bad rows without raising.
+    """
+    fixture_date = fixture_data.get('date') or fixture_data.get('kickoff_datetime') or fixture_data.get('fixture_date')
+    if not fixture_date:
+        return None, 'no date'
+
+    if isinstance(fixture_date, datetime):
+        return normalize_kickoff(fixture_date), None
+
+    if isinstance(fixture_date, str):
+        kickoff_datetime = parse_flexible_date(fixture_date)
+        if kickoff_datetime:
+            return kickoff_datetime, None
+
+    return None, f'invalid date format: {fixture_date}'
+
+def resolve_home_away(value, default=None):
+    """
+    Normalise a Home/Away value to 'Home' or 'Away'.
+    Returns (home_away, None), falling back to default when one is given,
+    or (None, reason) if the value cannot be interpreted.
+    """
+    value = (value or '').strip().lower()
+    home_away = _HA_MAP.get(value)
+    if home_away:
+        return home_away, None
+    if default:
+        return default, None
+    if not value:
+        return None, 'no home/away value'
+    return None, f'invalid home/away value: {value}'
+
+def fixture_text(fixture_data, *keys):
+    """
+    Text for a fixture column from the first of keys with a value, stripped,
+    or 'TBC'. Returns None if the row has none of the keys, so an existing
+    fixture keeps its stored value.
+    """
+    if not any(key in fixture_data for key in keys):
+        return None
+    return next(filter(None, ((fixture_data.get(key) or '').strip() for key in keys)), 'TBC')
+
+def upsert_fixtures_with_tasks(session, organization_id, fixture_rows):
+    """
+    Insert or update fixtures matched on (team_id, kickoff_datetime) within the
+    organization and create the matching email task for any fixture that does
+    not have one.
+    fixture_rows is a list of Fixture column dicts with distinct keys; an
+    opposition_name or kickoff_time_text of None keeps an existing fixture's
+    value and is stored as 'TBC' on a new one.
+    Returns (new_fixtures, updated_fixtures, new_tasks).
+    """
+    new_fixtures = updated_fixtures = new_tasks = 0
+
+    # Work a chunk at a time: one query finds the chunk's existing fixtures and
+    # one finds which of those already have a task, then the updates, inserts
+    # and new tasks are each written with a single executemany. Chunking keeps
+    # the IN lists under the bind parameter limit.
+    for start in range(0, len(fixture_rows), UPSERT_CHUNK_SIZE):
+        chunk = fixture_rows[start:start + UPSERT_CHUNK_SIZE]
+
+        existing = {}
+        for fixture in session.execute(
+            select(
+                Fixture.id, Fixture.team_id, Fixture.kickoff_datetime,
+                Fixture.opposition_name, Fixture.kickoff_time_text
+            ).where(
+                Fixture.organization_id == organization_id,
+                tuple_(Fixture.team_id, Fixture.kickoff_datetime).in_(
+                    [(row['team_id'], row['kickoff_datetime']) for row in chunk]
+                )
+            )
+        ):
+            # Only one fixture per team and kickoff is updated
+            existing.setdefault((fixture.team_id, fixture.kickoff_datetime), fixture)
+
+        updated_rows = []
+        new_rows = []
+        for row in chunk:
+            fixture = existing.get((row['team_id'], row['kickoff_datetime']))
+            if fixture:
+                updated_rows.append({
+                    'id': fixture.id,
+                    'opposition_name': row['opposition_name'] or fixture.opposition_name or 'TBC',
+                    'home_away': row['home_away'],
+                    'kickoff_time_text': row['kickoff_time_text'] or fixture.kickoff_time_text or 'TBC'
+                })
+            else:
+                # Ids are set here so the new fixtures' tasks can refer to them
+                new_rows.append({
+                    **row,
+                    'id': uuid.uuid4(),
+                    'opposition_name': row['opposition_name'] or 'TBC',
+                    'kickoff_time_text': row['kickoff_time_text'] or 'TBC'
+                })
+
+        # Fixtures that already have a task keep it
+        has_task = set()
+        if updated_rows:
+            has_task.update(session.scalars(
+                select(Task.fixture_id).where(Task.fixture_id.in_([row['id'] for row in updated_rows]))
+            ))
+        task_rows = [
+            {
+                'organization_id': organization_id,
+                'fixture_id': row['id'],
+                'task_type': 'home_email' if row['home_away'] == 'Home' else 'away_email',
+                'status': 'pending' if row['home_away'] == 'Home' else 'waiting'
+            }
+            for row in chain(updated_rows, new_rows)
+            if row['id'] not in has_task
+        ]
+
+        if updated_rows:
+            session.execute(update(Fixture), updated_rows)
+        if new_rows:
+            session.execute(insert(Fixture), new_rows)
+        if task_rows:
+            session.execute(insert(Task), task_rows)
+
+        new_fixtures += len(new_rows)
+        updated_fixtures += len(updated_rows)
+        new_tasks += len(task_rows)
+
+    return new_fixtures, updated_fixtures, new_tasks
+
+def process_sheet_fixtures(session, org, fixtures_data, managed_teams_by_name=None):
+    """Process fixtures from weekly sheet refresher.
+    managed_teams_by_name optionally maps already-loaded team names to Team objects."""
     skipped_count = 0
+    duplicate_rows = 0
+    fixture_rows = {}
+    
+    # Resolve every distinct team up front rather than once per row, only
+    # querying for names the caller has not already loaded
+    team_names = {(fixture_data.get('team') or '').strip() for fixture_data in fixtures_data}
+    teams_by_name = dict(managed_teams_by_name or {})
+    teams_by_name.update(get_or_create_teams(session, org.id, team_names - teams_by_name.keys()))
     
     for fixture_data in fixtures_data:
         try:
-            team_name = fixture_data.get('team', '').strip()
+            team_name = (fixture_data.get('team') or '').strip()
             if not team_name:
-                print(f"DEBUG: Skipping fixture - no team name: {fixture_data}")
+                logger.debug("Skipping sheet fixture - no team name: %s", fixture_data)
                 skipped_count += 1
                 continue
             
-            # Get or create team
-            team = get_or_create_team(session, org.id, team_name)
+            team = teams_by_name[team_name]
             
             # Parse date
-            fixture_date = fixture_data.get('date')
-            if not fixture_date:
-                print(f"DEBUG: Skipping fixture - no date: {fixture_data}")
-                skipped_count += 1
-                continue
-                
-            kickoff_datetime = parse_flexible_date(fixture_date)
-                
+            kickoff_datetime, reason = parse_row_date(fixture_data)
             if not kickoff_datetime:
-                print(f"DEBUG: Skipping fixture - invalid date format: {fixture_date}")
+                logger.debug("Skipping sheet fixture - %s: %s", reason, fixture_data)
                 skipped_count += 1
                 continue
             
             # Determine Home/Away
-            home_away = fixture_data.get('home_away', 'Home').capitalize()
-            if home_away not in ['Home', 'Away']:
-                home_away = 'Home'
+            home_away, _ = resolve_home_away(fixture_data.get('home_away'), default='Home')
+            opposition = fixture_text(fixture_data, 'opposition')
+            time_text = fixture_text(fixture_data, 'time', 'kickoff_time')
             
-            # Check if fixture exists
-            existing = session.query(Fixture).filter(
-                Fixture.organization_id == org.id,
-                Fixture.team_id == team.id,
-                Fixture.kickoff_datetime == kickoff_datetime
-            ).first()
-            
-            if existing:
-                existing.opposition_name = fixture_data.get('opposition', existing.opposition_name) or 'TBC'
-                existing.home_away = home_away
-                existing.kickoff_time_text = fixture_data.get('time', existing.kickoff_time_text) or 'TBC'
-                # existing.pitch_name = fixture_data.get('pitch', '') 
-                updated_fixtures += 1
-                fixture = existing
-            else:
-                fixture = Fixture(
-                    organization_id=org.id,
-                    team_id=team.id,
-                    opposition_name=fixture_data.get('opposition', 'TBC') or 'TBC',
-                    home_away=home_away,
-                    kickoff_datetime=kickoff_datetime,
-                    kickoff_time_text=fixture_data.get('time', 'TBC') or 'TBC'
-                )
-                session.add(fixture)
-                session.flush()
-                new_fixtures += 1
-            
-            # Create task if doesn't exist
-            existing_task = session.query(Task).filter_by(fixture_id=fixture.id).first()
-            if not existing_task:
-                task_type = 'home_email' if home_away == 'Home' else 'away_email'
-                task_status = 'pending' if home_away == 'Home' else 'waiting'
-                task = Task(
-                    organization_id=org.id,
-                    fixture_id=fixture.id,
-                    task_type=task_type,
-                    status=task_status
-                )
-                session.add(task)
-                new_tasks += 1
+            # Queue the row for the upsert after the loop; a repeat of the
+            # same team/kickoff replaces the queued row
+            key = (team.id, kickoff_datetime)
+            if key in fixture_rows:
+                duplicate_rows += 1
+            fixture_rows[key] = {
+                'organization_id': org.id,
+                'team_id': team.id,
+                'opposition_name': opposition,
+                'home_away': home_away,
+                'kickoff_datetime': kickoff_datetime,
+                'kickoff_time_text': time_text
+            }
                 
         except Exception as e:
             logger.warning(f"Error processing refreshed fixture: {e}")
             skipped_count += 1
             continue
+    
+    new_fixtures, updated_fixtures, new_tasks = upsert_fixtures_with_tasks(
+        session, org.id, list(fixture_rows.values())
+    )
             
-    return new_fixtures, updated_fixtures, new_tasks, skipped_count
+    return new_fixtures, updated_fixtures + duplicate_rows, new_tasks, skipped_count
 
-def handle_google_import(session, org, managed_team_names):
+def set_org_setting(session, org, key, value):
+    """
+    Set a value in the organization's settings JSON without committing,
+    so it is saved by the handler's single commit. org is usually the
+    detached one from get_user_organization, so it is merged into session
+    first.
+    """
+    org = session.merge(org)
+    if not org.settings:
+        org.settings = {}
+    org.settings[key] = value
+    # Force SQLAlchemy to detect change in JSON field
+    flag_modified(org, "settings")
+
+def handle_google_import(session, org, managed_teams_by_name):
     """Handle Google Sheets import"""
     google_sheets_url = request.form.get('google_sheets_url', '').strip()
     if not google_sheets_url:
@@ -1100,14 +1366,8 @@ def handle_google_import(session, org, managed_team_names):
         return redirect(url_for('imports.import_fixtures'))
     
     try:
-        # Save the URL for future refreshes
-        if not org.settings:
-            org.settings = {}
-        org.settings['google_sheet_url'] = google_sheets_url
-        # Force SQLAlchemy to detect change in JSON field
-        from sqlalchemy.orm.attributes import flag_modified
-        flag_modified(org, "settings")
-        session.commit()
+        # Save the URL for future refreshes - committed with the imported fixtures
+        set_org_setting(session, org, 'google_sheet_url', google_sheets_url)
         
         from weekly_sheet_refresher import refresh_weekly_fixtures
         fixtures_data, errors = refresh_weekly_fixtures(google_sheets_url)
@@ -1116,9 +1376,10 @@ def handle_google_import(session, org, managed_team_names):
             for error in errors:
                 flash(error, 'error')
             if not fixtures_data:
+                session.commit()
                 return redirect(url_for('imports.import_fixtures'))
         
-        new_fixtures, updated_fixtures, new_tasks, skipped_count = process_sheet_fixtures(session, org, fixtures_data)
+        new_fixtures, updated_fixtures, new_tasks, skipped_count = process_sheet_fixtures(session, org, fixtures_data, managed_teams_by_name)
         session.commit()
         
         flash(f'Successfully imported {new_fixtures} new fixture(s), updated {updated_fixtures}.', 'success')
@@ -1128,16 +1389,16 @@ def handle_google_import(session, org, managed_team_names):
         flash(f'Error importing from Google Sheets: {str(e)}', 'error')
         return redirect(url_for('imports.import_fixtures'))
 
-def handle_paste_import(session, org, managed_team_names):
+def handle_paste_import(session, org, managed_teams_by_name):
     """Handle pasted FA data import"""
     fa_fixture_text = request.form.get('fa_fixture_text', '').strip()
     if not fa_fixture_text:
         flash('Please paste fixture data', 'error')
         return redirect(url_for('imports.import_fixtures'))
     
-    return handle_paste_import_internal(session, org, managed_team_names, fa_fixture_text)
+    return handle_paste_import_internal(session, org, managed_teams_by_name, fa_fixture_text)
 
-def handle_url_import(session, org, managed_team_names):
+def handle_url_import(session, org, managed_teams_by_name):
     """Handle FA URL import - auto-detect single vs multi-team"""
     fa_url = request.form.get('fa_url', '').strip()
     specified_team = request.form.get('url_team', '').strip()
@@ -1149,13 +1410,13 @@ def handle_url_import(session, org, managed_team_names):
         return redirect(url_for('imports.import_fixtures'))
     
     try:
-        from refresh_fa_fixtures import refresh_club_fixtures, refresh_team_fixtures
+        from fa_fixtures_scraper import scrape_team_fixtures
+        from refresh_fa_fixtures import save_club_fixtures, save_team_fixtures
         
-        # Check if URL looks like a single team URL (has selectedTeam parameter) vs club URL (has selectedClub)
-        is_club_url = 'selectedClub=' in fa_url and 'selectedTeam=' not in fa_url
-        is_team_url = 'selectedTeam=' in fa_url
+        # Parse the query once to see whether the URL names a single team
+        selected_team = parse_qs(urlparse(fa_url).query).get('selectedTeam', [''])[0]
         
-        result = None
+        team = None
         url_saved_to = None
         
         if specified_team:
@@ -1169,56 +1430,47 @@ def handle_url_import(session, org, managed_team_names):
             if team:
                 # Save URL to team
                 team.fa_fixtures_url = fa_url
-                session.commit()
                 url_saved_to = f"Team: {specified_team}"
-                
-                # Import fixtures for this team - use non-headless for CAPTCHA solving
-                result = refresh_team_fixtures(team, headless=False)
             else:
                 if request.is_json:
                     return jsonify({'error': f'Team "{specified_team}" not found'}), 404
                 flash(f'Team "{specified_team}" not found', 'error')
                 return redirect(url_for('imports.import_fixtures'))
         
-        elif is_team_url and not is_club_url:
-            # Single team URL - try to detect which team
-            # Extract team ID from URL if possible
-            team_match = re.search(r'selectedTeam=(\d+)', fa_url)
-            if team_match:
-                # This is a single team URL but we don't know which team
-                # Import as club-wide and let matching logic handle it
-                if not org.settings:
-                    org.settings = {}
-                org.settings['club_fixtures_url'] = fa_url
-                session.commit()
-                url_saved_to = "Club-wide URL (auto-detected)"
-                result = refresh_club_fixtures(org, fa_url, headless=False)
-            else:
-                # Can't determine - use club-wide import
-                if not org.settings:
-                    org.settings = {}
-                org.settings['club_fixtures_url'] = fa_url
-                session.commit()
-                url_saved_to = "Club-wide URL"
-                result = refresh_club_fixtures(org, fa_url, headless=False)
+        else:
+            # Club-wide URL, or a single team URL where we don't know which
+            # team it is - import club-wide and let matching logic handle it
+            set_org_setting(session, org, 'club_fixtures_url', fa_url)
+            url_saved_to = "Club-wide URL (auto-detected)" if selected_team[:1].isdigit() else "Club-wide URL"
         
-        elif is_club_url or not is_team_url:
-            # Club-wide URL
-            if not org.settings:
-                org.settings = {}
-            org.settings['club_fixtures_url'] = fa_url
-            session.commit()
-            url_saved_to = "Club-wide URL"
-            result = refresh_club_fixtures(org, fa_url, headless=False)
+        # Save the URL and end the transaction before scraping, so no
+        # connection is held while the scraper runs - it is non-headless for
+        # CAPTCHA solving and can take minutes
+        session.commit()
         
+        result = {
+            'success': False,
+            'total_fixtures': 0,
+            'fixtures_imported': 0,
+            'teams_matched': [],
+            'error': None
+        }
+        try:
+            scraped_fixtures = scrape_team_fixtures(fa_url, team_name=specified_team or None, headless=False)
+        except Exception as e:
+            logger.error("Error scraping %s: %s", fa_url, e, exc_info=True)
+            result['error'] = str(e)
         else:
-            # Default to club-wide
-            if not org.settings:
-                org.settings = {}
-            org.settings['club_fixtures_url'] = fa_url
+            result['total_fixtures'] = len(scraped_fixtures)
+            if team:
+                result.update(fixtures_created=0, fixtures_updated=0)
+                save_team_fixtures(session, team, scraped_fixtures, result)
+                result['fixtures_imported'] = result['fixtures_created'] + result['fixtures_updated']
+                result['teams_matched'] = [specified_team]
+                result['success'] = True
+            else:
+                result['success'] = save_club_fixtures(session, org, scraped_fixtures, result)
             session.commit()
-            url_saved_to = "Club-wide URL"
-            result = refresh_club_fixtures(org, fa_url, headless=False)
         
         if result and result.get('success'):
             response_data = {
@@ -1249,14 +1501,22 @@ def handle_url_import(session, org, managed_team_names):
         
     except Exception as e:
         session.rollback()
-        logger.error(f"Error in handle_url_import: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
+        # exc_info lets logging format the traceback only if the record is emitted
+        logger.error("Error in handle_url_import: %s", e, exc_info=True)
         if request.is_json:
             return jsonify({'error': str(e)}), 500
         flash(f'Error importing from URL: {str(e)}', 'error')
         return redirect(url_for('imports.import_fixtures'))
 
+# Handlers for each import_method value posted by the unified import page
+_IMPORT_DISPATCH = {
+    'manual': handle_manual_import,
+    'csv': handle_csv_import,
+    'google': handle_google_import,
+    'paste': handle_paste_import,
+    'url': handle_url_import
+}
+
 @imports_bp.route('/import-fixtures', methods=['GET', 'POST'])
 @login_required
 def import_fixtures():
@@ -1268,27 +1528,29 @@ def import_fixtures():
             flash('No organization found.', 'error')
             return redirect(url_for('auth.logout'))
         
-        # Get context data
-        managed_teams = session.query(Team).filter_by(
-            organization_id=org.id,
-            is_managed=True
-        ).all()
-        managed_team_names = [team.name for team in managed_teams]
-        
-        pitches = session.query(Pitch).filter_by(organization_id=org.id).all()
-        pitches_dict = {pitch.name: {'name': pitch.name} for pitch in pitches}
-        
-        # Generate embeddable URL for Google Sheets preview pane
-        weekly_sheet_url = org.settings.get('weekly_sheet_url') if org.settings else None
-        sheet_embed_url = None
-        if weekly_sheet_url:
-            import re as re_mod
-            sheet_match = re_mod.search(r'/spreadsheets/d/([a-zA-Z0-9_-]+)', weekly_sheet_url)
-            if sheet_match:
-                sheet_id = sheet_match.group(1)
-                sheet_embed_url = f'https://docs.google.com/spreadsheets/d/{sheet_id}/preview'
-        
         if request.method == 'GET':
+            # The page only shows team and pitch names, so load just those;
+            # pitches and the sheet preview are not needed by POSTs at all
+            managed_team_names = [
+                name for name, in session.query(Team.name).filter_by(
+                    organization_id=org.id,
+                    is_managed=True
+                )
+            ]
+            pitches_dict = {
+                name: {'name': name}
+                for name, in session.query(Pitch.name).filter_by(organization_id=org.id)
+            }
+            
+            # Generate embeddable URL for Google Sheets preview pane
+            weekly_sheet_url = org.settings.get('weekly_sheet_url') if org.settings else None
+            sheet_embed_url = None
+            if weekly_sheet_url:
+                sheet_match = re.search(r'/spreadsheets/d/([a-zA-Z0-9_-]+)', weekly_sheet_url)
+                if sheet_match:
+                    sheet_id = sheet_match.group(1)
+                    sheet_embed_url = f'https://docs.google.com/spreadsheets/d/{sheet_id}/preview'
+            
             return render_template('import_fixtures.html',
                                  user_name=current_user.name,
                                  managed_teams=managed_team_names,
@@ -1296,28 +1558,25 @@ def import_fixtures():
                                  weekly_sheet_url=weekly_sheet_url,
                                  sheet_embed_url=sheet_embed_url)
         
-        # Handle POST - route to appropriate handler based on import_method
+        # Handle POST - the import handlers work with the managed Team objects
+        managed_teams = session.query(Team).filter_by(
+            organization_id=org.id,
+            is_managed=True
+        ).all()
+        managed_teams_by_name = {team.name: team for team in managed_teams}
+        
+        # Route to appropriate handler based on import_method
         import_method = request.form.get('import_method', 'manual')
         
-        if import_method == 'manual':
-            return handle_manual_import(session, org, managed_team_names)
-        elif import_method == 'csv':
-            return handle_csv_import(session, org, managed_team_names)
-        elif import_method == 'google':
-            return handle_google_import(session, org, managed_team_names)
-        elif import_method == 'paste':
-            return handle_paste_import(session, org, managed_team_names)
-        elif import_method == 'url':
-            return handle_url_import(session, org, managed_team_names)
-        else:
-            flash('Invalid import method', 'error')
-            return redirect(url_for('imports.import_fixtures'))
+        handler = _IMPORT_DISPATCH.get(import_method)
+        if handler:
+            return handler(session, org, managed_teams_by_name)
+        flash('Invalid import method', 'error')
+        return redirect(url_for('imports.import_fixtures'))
             
     except Exception as e:
         session.rollback()
-        logger.error(f"Error in import_fixtures: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.error("Error in import_fixtures: %s", e, exc_info=True)
         flash(f'Error: {str(e)}', 'error')
         return redirect(url_for('imports.import_fixtures'))
     finally:
@@ -1360,15 +1619,13 @@ def bulk_coach_upload():
                                      managed_teams=[],
                                      error_message="No organization found. Please contact support.")
 
-            # Get teams that this user manages by querying teams directly
-            managed_teams = []
-            teams_with_coaches = session.query(Team).join(TeamCoach).filter(
-                TeamCoach.organization_id == org.id
-            ).distinct().all()
-
-            for team in teams_with_coaches:
-                if team.name not in managed_teams:
-                    managed_teams.append(team.name)
+            # Get the names of teams that have coaches, distinct and sorted
+            # by the database
+            managed_teams = [
+                name for name, in session.query(Team.name).join(TeamCoach).filter(
+                    TeamCoach.organization_id == org.id
+                ).distinct().order_by(Team.name)
+            ]
 
             return render_template('bulk_upload.html',
                                  upload_type='coaches',
@@ -1378,19 +1635,13 @@ def bulk_coach_upload():
         # Handle POST request for CSV upload
         if 'confirm_save' in request.form:
             # User confirmed - save the data
-            csv_data = request.form.get('csv_data', '')
+            csv_data = load_pending_csv(session, request.form)
             if not csv_data:
                 flash('No CSV data found. Please try uploading again.', 'error')
                 return redirect(url_for('settings.settings_view'))
 
             # Get column mappings
-            mappings = {}
-            for key in request.form:
-                if key.startswith('mapping_'):
-                    csv_column = key[8:]  # Remove 'mapping_' prefix
-                    db_field = request.form[key]
-                    if db_field:
-                        mappings[csv_column] = db_field
+            mappings = mapping_from_form(request.form)
 
             # Get selected indices if present
             selected_indices = request.form.getlist('selected_indices')
@@ -1403,6 +1654,7 @@ def bulk_coach_upload():
             update_existing = 'update_existing' in request.form
             org = get_user_organization()
             result = process_coach_csv(session, org.id, csv_data, update_existing, mappings, selected_indices)
+            discard_pending_csv(session, request.form)
 
             if result['errors']:
                 for error in result['errors']:
@@ -1416,29 +1668,25 @@ def bulk_coach_upload():
 
         elif 'mapping_step' in request.form:
             # User has completed column mapping - show preview/confirmation
-            csv_data = request.form.get('csv_data', '')
+            csv_data = load_pending_csv(session, request.form)
             if not csv_data:
                 flash('No CSV data found. Please try uploading again.', 'error')
                 return redirect(url_for('settings.settings_view'))
 
             # Get column mappings
-            mappings = {}
-            for key in request.form:
-                if key.startswith('mapping_'):
-                    csv_column = key[8:]  # Remove 'mapping_' prefix
-                    db_field = request.form[key]
-                    if db_field:
-                        mappings[csv_column] = db_field
+            mappings = mapping_from_form(request.form)
 
             # Generate preview data
             preview_data = preview_coach_csv(csv_data, mappings)
             update_existing = 'update_existing' in request.form
+            csv_token = request.form.get('csv_token') or store_pending_csv(session, csv_data)
 
             return render_template('bulk_upload.html',
                                  upload_type='coaches',
                                  user_name=current_user.name,
                                  managed_teams=[],
                                  show_confirmation=True,
+                                 csv_token=csv_token,
                                  csv_data=csv_data,
                                  mappings=mappings,
                                  preview_data=preview_data,
@@ -1464,6 +1712,10 @@ def bulk_coach_upload():
             # Analyze the CSV structure
             analysis = analyze_csv_columns(csv_data)
 
+            # Keep the CSV server-side for the next steps, so the forms post
+            # back a token rather than the whole file
+            csv_token = store_pending_csv(session, csv_data)
+
             if not analysis['needs_manual_mapping']:
                 # We can auto-map - show confirmation with preview
                 update_existing = 'update_existing' in request.form
@@ -1474,6 +1726,7 @@ def bulk_coach_upload():
                                      user_name=current_user.name,
                                      managed_teams=[],
                                      show_confirmation=True,
+                                     csv_token=csv_token,
                                      csv_data=csv_data,
                                      mappings=analysis['suggested_mapping'],
                                      preview_data=preview_data,
@@ -1487,6 +1740,7 @@ def bulk_coach_upload():
                                      user_name=current_user.name,
                                      managed_teams=[],
                                      show_mapping=True,
+                                     csv_token=csv_token,
                                      csv_data=csv_data,
                                      analysis=analysis,
                                      update_existing=update_existing)
@@ -1497,6 +1751,105 @@ def bulk_coach_upload():
     finally:
         session.close()
 
+def is_fixture_sec(value):
+    """Check whether a role looks like a fixture secretary"""
+    return bool(_FIXTURE_SEC_RE.match(value or ''))
+
+def iter_workbook_sheets(file):
+    """
+    Stream each sheet of an uploaded workbook with openpyxl in read-only mode.
+    Sheets named like templates or summaries are skipped unless nothing else
+    is left. Yields (headers, rows) per sheet that has a header row, where
+    rows is an iterator of cell value tuples with fully blank rows skipped.
+    """
+    # Imported here since only workbook uploads need it
+    import openpyxl
+    
+    wb = openpyxl.load_workbook(file, read_only=True, data_only=True)
+    try:
+        worksheets = [ws for ws in wb.worksheets if not _SKIP_SHEET_RE.search(ws.title)] or wb.worksheets
+        for ws in worksheets:
+            rows = ws.iter_rows(values_only=True)
+            header_row = next(rows, None)
+            if not header_row:
+                continue
+            headers = [str(h) if h is not None else f'Unnamed: {i}' for i, h in enumerate(header_row)]
+            yield headers, (row for row in rows if any(cell is not None and cell != '' for cell in row))
+    finally:
+        wb.close()
+
+def read_contact_workbook(file):
+    """
+    Read every sheet of a club contacts workbook into a single CSV string.
+    Blank club/team/contact/role cells are filled down from the row above,
+    since club names are often entered once and merged across rows. If a
+    sheet has a role column, only fixture secretaries are kept, falling back
+    to any secretary. Returns None if no sheet has any data.
+    """
+    fieldnames = {}
+    kept_rows = []
+    for headers, rows in iter_workbook_sheets(file):
+        # Forward fill blank cells to handle merged rows, only in the columns
+        # the contact import reads
+        fill_columns = [i for i, h in enumerate(headers) if _FILL_DOWN_HEADER_RE.search(h)]
+        last = [None] * len(headers)
+        sheet_rows = []
+        for row in rows:
+            values = [None] * len(headers)
+            for i, cell in enumerate(row[:len(headers)]):
+                if cell is not None and cell != '':
+                    values[i] = str(cell)
+            for i in fill_columns:
+                if values[i] is None:
+                    values[i] = last[i]
+                else:
+                    last[i] = values[i]
+            sheet_rows.append(values)
+        if not sheet_rows:
+            continue
+        
+        # Filter for "Fixture Secretary" using the first role-like column
+        role_idx = next((i for i, h in enumerate(headers) if _ROLE_HEADER_RE.search(h)), None)
+        if role_idx is not None:
+            # One pass over the role column; fallback: maybe just "Secretary"?
+            fixture_secs = []
+            secretaries = []
+            for row in sheet_rows:
+                role = row[role_idx] or ''
+                if 'secretary' in role.lower():
+                    secretaries.append(row)
+                    if is_fixture_sec(role):
+                        fixture_secs.append(row)
+            sheet_rows = fixture_secs or secretaries or sheet_rows
+        
+        fieldnames.update(dict.fromkeys(headers))
+        kept_rows.extend(
+            {h: v for h, v in zip(headers, row) if v is not None}
+            for row in sheet_rows
+        )
+    
+    if not kept_rows:
+        return None
+    
+    return rows_to_csv(list(fieldnames), kept_rows)
+
+def read_team_workbook(file):
+    """
+    Read every sheet of a team list workbook as row dicts of strings.
+    Returns (headers, rows) where headers covers the columns of all sheets.
+    """
+    fieldnames = {}
+    all_rows = []
+    for headers, rows in iter_workbook_sheets(file):
+        sheet_rows = [
+            {h: '' if v is None else str(v) for h, v in zip_longest(headers, row[:len(headers)])}
+            for row in rows
+        ]
+        if sheet_rows:
+            fieldnames.update(dict.fromkeys(headers))
+            all_rows.extend(sheet_rows)
+    return list(fieldnames), all_rows
+
 @imports_bp.route('/bulk_contact_upload', methods=['GET', 'POST'])
 @login_required
 def bulk_contact_upload():
@@ -1523,69 +1876,10 @@ def bulk_contact_upload():
                     csv_data = file.read().decode('utf-8')
                 elif filename.endswith(('.xlsx', '.xls')):
                     try:
-                        # Read Excel file - sheet_name=None reads all sheets
-                        # header=None to read raw first, or assume header is row 0
-                        # We'll read with header=0 by default, but we need to handle merged cells
-                        
-                        # Use openpyxl engine which can help with some things, but pandas handles basic merge by filling NaN
-                        # We need to explicitly forward fill (ffill) to handle "merged across multiple rows" behavior
-                        # But standard read_excel puts NaN in merged cells after the first one.
-                        
-                        dfs = pd.read_excel(file, sheet_name=None, dtype=str)
-                        
-                        # Combine all sheets
-                        all_data = []
-                        for sheet_name, df in dfs.items():
-                            if df.empty:
-                                continue
-                                
-                            # 1. Handle Merged Cells (Forward Fill)
-                            # "Club name is often only entered once and then merged across multiple columns" (rows likely meant)
-                            # We forward fill all columns to propagate values down merged rows
-                            df = df.ffill()
-                            
-                            # 2. Filter for "Fixture Secretary"
-                            # We look for a column that might contain roles
-                            role_col = None
-                            for col in df.columns:
-                                if 'role' in str(col).lower() or 'position' in str(col).lower() or 'title' in str(col).lower():
-                                    role_col = col
-                                    break
-                            
-                            # If we found a role column, filter for Fixture Secretary
-                            if role_col:
-                                # Normalize text for comparison
-                                # We look for "Secretary" or "Fixture" to be safe, or exact match?
-                                # User said "extract the fixture secretary".
-                                # Let's try to be smart: if "Fixture Secretary" exists, keep only those.
-                                
-                                # Create a mask for rows that look like fixture secretaries
-                                # We'll be lenient: contains "secretary" AND ("fixture" or "sec")
-                                def is_fixture_sec(val):
-                                    val = str(val).lower()
-                                    return 'secretary' in val and ('fixture' in val or 'fix' in val)
-                                
-                                # Check if any row matches this strict criteria
-                                has_fix_sec = df[role_col].apply(is_fixture_sec).any()
-                                
-                                if has_fix_sec:
-                                    df = df[df[role_col].apply(is_fixture_sec)]
-                                else:
-                                    # Fallback: maybe just "Secretary"?
-                                    if df[role_col].str.contains('Secretary', case=False, na=False).any():
-                                         df = df[df[role_col].str.contains('Secretary', case=False, na=False)]
-                            
-                            # Add to collection
-                            all_data.append(df)
-                        
-                        if all_data:
-                            combined_df = pd.concat(all_data, ignore_index=True)
-                            # Convert to CSV string
-                            csv_data = combined_df.to_csv(index=False)
-                        else:
+                        csv_data = read_contact_workbook(file)
+                        if not csv_data:
                             flash('Excel file appears to be empty', 'error')
                             return redirect(url_for('imports.bulk_contact_upload'))
-                            
                     except Exception as e:
                         flash(f'Error reading Excel file: {str(e)}', 'error')
                         return redirect(url_for('imports.bulk_contact_upload'))
@@ -1610,11 +1904,7 @@ def bulk_contact_upload():
         # Check if this is a confirmation save
         if request.form.get('confirm_save') == 'true':
             # Reconstruct mapping from form
-            mapping = {}
-            for key, value in request.form.items():
-                if key.startswith('mapping_') and value:
-                    original_header = key.replace('mapping_', '')
-                    mapping[original_header] = value
+            mapping = mapping_from_form(request.form)
             
             # Get selected indices if present
             selected_indices = request.form.getlist('selected_indices')
@@ -1636,12 +1926,8 @@ def bulk_contact_upload():
 
         # Check if this is a mapping step
         if request.form.get('mapping_step') == 'true':
-             # Reconstruct mapping from form
-            mapping = {}
-            for key, value in request.form.items():
-                if key.startswith('mapping_') and value:
-                    original_header = key.replace('mapping_', '')
-                    mapping[original_header] = value
+            # Reconstruct mapping from form
+            mapping = mapping_from_form(request.form)
                     
             preview = preview_contact_csv(csv_data, mapping)
             return render_template('bulk_upload.html', 
@@ -1786,18 +2072,12 @@ def save_refreshed_fixtures():
         # Process form data
         fixtures_to_save = []
         
-        # Iterate through form keys to find fixtures
-        # We expect keys like fixture_0_data, fixture_0_pitch_id, etc.
-        # Find max index
-        max_index = -1
-        for key in request.form:
-            if key.startswith('fixture_') and '_data' in key:
-                try:
-                    idx = int(key.split('_')[1])
-                    if idx > max_index:
-                        max_index = idx
-                except:
-                    pass
+        # Bucket the fixture_<i>_<field> form keys by index in a single pass
+        form_fixtures = {}
+        for key, value in request.form.items():
+            match = _FIXTURE_FIELD_RE.match(key)
+            if match:
+                form_fixtures.setdefault(int(match.group(1)), {})[match.group(2)] = value
         
         new_fixtures = 0
         updated_fixtures = 0
@@ -1806,40 +2086,77 @@ def save_refreshed_fixtures():
         from models import PitchAlias
         # parse_flexible_date is defined in this module
         
-        for i in range(max_index + 1):
-            fixture_json = request.form.get(f'fixture_{i}_data')
-            import_fixture = request.form.get(f'fixture_{i}_import')
-            
-            if not fixture_json or not import_fixture:
+        # Collect the selected fixtures first so existing rows can be loaded in bulk
+        for i in sorted(form_fixtures):
+            fields = form_fixtures[i]
+            if not fields.get('data') or not fields.get('import'):
                 continue
                 
-            fixture_data = json.loads(fixture_json)
-            pitch_id = request.form.get(f'fixture_{i}_pitch_id')
-            save_alias = request.form.get(f'fixture_{i}_save_alias')
-            sheet_pitch = request.form.get(f'fixture_{i}_sheet_pitch')
+            fixtures_to_save.append({
+                'data': json.loads(fields['data']),
+                'pitch_id': fields.get('pitch_id'),
+                'save_alias': fields.get('save_alias'),
+                'sheet_pitch': fields.get('sheet_pitch')
+            })
+        
+        # Resolve every team in one query; new teams are only flushed so the
+        # whole save commits once at the end
+        teams_by_name = get_or_create_teams(
+            session, org.id, {item['data'].get('team', '') for item in fixtures_to_save}
+        )
+        
+        team_ids = [team.id for team in teams_by_name.values()]
+        existing_fixtures = {
+            (fixture.team_id, fixture.kickoff_datetime): fixture
+            for fixture in session.query(Fixture).filter(
+                Fixture.organization_id == org.id,
+                Fixture.team_id.in_(team_ids)
+            ).all()
+        } if team_ids else {}
+        fixture_ids_with_tasks = {
+            fixture_id
+            for (fixture_id,) in session.query(Task.fixture_id).filter(
+                Task.fixture_id.in_([fixture.id for fixture in existing_fixtures.values()])
+            )
+        } if existing_fixtures else set()
+        
+        alias_names = {item['sheet_pitch'] for item in fixtures_to_save if item['save_alias'] and item['sheet_pitch']}
+        existing_aliases = {
+            alias
+            for (alias,) in session.query(PitchAlias.alias).filter(
+                PitchAlias.organization_id == org.id,
+                PitchAlias.alias.in_(alias_names)
+            )
+        } if alias_names else set()
+        
+        # New rows are collected here and inserted in bulk before the commit.
+        # Fixture ids are generated up front so tasks can reference them.
+        new_alias_rows = []
+        new_fixture_rows = {}
+        new_task_rows = []
+        
+        for item in fixtures_to_save:
+            fixture_data = item['data']
+            pitch_id = item['pitch_id']
+            save_alias = item['save_alias']
+            sheet_pitch = item['sheet_pitch']
             
             # Handle Alias Saving
             if save_alias and sheet_pitch and pitch_id:
-                # Check if alias exists
-                existing_alias = session.query(PitchAlias).filter(
-                    PitchAlias.organization_id == org.id,
-                    PitchAlias.alias == sheet_pitch
-                ).first()
-                
-                if not existing_alias:
-                    new_alias = PitchAlias(
-                        organization_id=org.id,
-                        pitch_id=pitch_id,
-                        alias=sheet_pitch
-                    )
-                    session.add(new_alias)
+                if sheet_pitch not in existing_aliases:
+                    new_alias_rows.append({
+                        'organization_id': org.id,
+                        'pitch_id': pitch_id,
+                        'alias': sheet_pitch
+                    })
+                    existing_aliases.add(sheet_pitch)
             
             # Save Fixture
             team_name = fixture_data.get('team', '').strip()
             if not team_name:
                 continue
                 
-            team = get_or_create_team(session, org.id, team_name)
+            team = teams_by_name[team_name]
             
             fixture_date = fixture_data.get('date')
             kickoff_datetime = parse_flexible_date(fixture_date)
@@ -1847,16 +2164,12 @@ def save_refreshed_fixtures():
             if not kickoff_datetime:
                 continue
                 
-            home_away = fixture_data.get('home_away', 'Home').capitalize()
-            if home_away not in ['Home', 'Away']:
-                home_away = 'Home'
+            home_away, _ = resolve_home_away(fixture_data.get('home_away'), default='Home')
                 
-            # Check if fixture exists
-            existing = session.query(Fixture).filter(
-                Fixture.organization_id == org.id,
-                Fixture.team_id == team.id,
-                Fixture.kickoff_datetime == kickoff_datetime
-            ).first()
+            # Check if fixture exists, or was added earlier in this submission
+            fixture_key = (team.id, kickoff_datetime)
+            existing = existing_fixtures.get(fixture_key)
+            pending = new_fixture_rows.get(fixture_key)
             
             if existing:
                 existing.opposition_name = fixture_data.get('opposition', existing.opposition_name) or 'TBC'
@@ -1865,35 +2178,48 @@ def save_refreshed_fixtures():
                 if pitch_id:
                     existing.pitch_id = pitch_id
                 updated_fixtures += 1
-                fixture = existing
+                fixture_id = existing.id
+            elif pending:
+                pending['opposition_name'] = fixture_data.get('opposition', pending['opposition_name']) or 'TBC'
+                pending['home_away'] = home_away
+                pending['kickoff_time_text'] = fixture_data.get('time', pending['kickoff_time_text']) or 'TBC'
+                if pitch_id:
+                    pending['pitch_id'] = pitch_id
+                updated_fixtures += 1
+                fixture_id = pending['id']
             else:
-                fixture = Fixture(
-                    organization_id=org.id,
-                    team_id=team.id,
-                    opposition_name=fixture_data.get('opposition', 'TBC') or 'TBC',
-                    home_away=home_away,
-                    kickoff_datetime=kickoff_datetime,
-                    kickoff_time_text=fixture_data.get('time', 'TBC') or 'TBC',
-                    pitch_id=pitch_id if pitch_id else None
-                )
-                session.add(fixture)
-                session.flush()
+                fixture_id = uuid.uuid4()
+                new_fixture_rows[fixture_key] = {
+                    'id': fixture_id,
+                    'organization_id': org.id,
+                    'team_id': team.id,
+                    'opposition_name': fixture_data.get('opposition', 'TBC') or 'TBC',
+                    'home_away': home_away,
+                    'kickoff_datetime': kickoff_datetime,
+                    'kickoff_time_text': fixture_data.get('time', 'TBC') or 'TBC',
+                    'pitch_id': pitch_id if pitch_id else None
+                }
                 new_fixtures += 1
             
             # Create task if doesn't exist
-            existing_task = session.query(Task).filter_by(fixture_id=fixture.id).first()
-            if not existing_task:
+            if fixture_id not in fixture_ids_with_tasks:
                 task_type = 'home_email' if home_away == 'Home' else 'away_email'
                 task_status = 'pending' if home_away == 'Home' else 'waiting'
-                task = Task(
-                    organization_id=org.id,
-                    fixture_id=fixture.id,
-                    task_type=task_type,
-                    status=task_status
-                )
-                session.add(task)
+                new_task_rows.append({
+                    'organization_id': org.id,
+                    'fixture_id': fixture_id,
+                    'task_type': task_type,
+                    'status': task_status
+                })
+                fixture_ids_with_tasks.add(fixture_id)
                 new_tasks += 1
                 
+        if new_alias_rows:
+            session.execute(insert(PitchAlias), new_alias_rows)
+        if new_fixture_rows:
+            session.execute(insert(Fixture), list(new_fixture_rows.values()))
+        if new_task_rows:
+            session.execute(insert(Task), new_task_rows)
         session.commit()
         flash(f'Successfully processed fixtures: {new_fixtures} new, {updated_fixtures} updated.', 'success')
         return redirect(url_for('dashboard.dashboard_view'))
@@ -1920,6 +2246,7 @@ def bulk_team_upload():
 
         # Handle POST
         csv_data = None
+        sheet_rows = None
         
         # Check if file upload
         if 'team_file' in request.files:
@@ -1930,15 +2257,12 @@ def bulk_team_upload():
                     csv_data = file.read().decode('utf-8')
                 elif filename.endswith(('.xlsx', '.xls')):
                     try:
-                        dfs = pd.read_excel(file, sheet_name=None, dtype=str)
-                        all_data = []
-                        for sheet_name, df in dfs.items():
-                            if not df.empty:
-                                all_data.append(df)
+                        headers, sheet_rows = read_team_workbook(file)
                         
-                        if all_data:
-                            combined_df = pd.concat(all_data, ignore_index=True)
-                            csv_data = combined_df.to_csv(index=False)
+                        if sheet_rows:
+                            # Keep the sheets as row dicts for analysis; CSV text
+                            # is only built for the mapping form round trip
+                            csv_data = rows_to_csv(headers, sheet_rows)
                         else:
                             flash('Excel file appears to be empty', 'error')
                             return redirect(url_for('imports.bulk_team_upload'))
@@ -1953,6 +2277,10 @@ def bulk_team_upload():
         if not csv_data and request.form.get('preview_text'):
             csv_data = request.form.get('preview_text')
             
+        # Check if passed from mapping/confirmation step
+        if not csv_data and request.form.get('csv_data'):
+            csv_data = request.form.get('csv_data')
+            
         if not csv_data:
             flash('No data provided', 'error')
             return redirect(url_for('imports.bulk_team_upload'))
@@ -1960,11 +2288,7 @@ def bulk_team_upload():
         # Check if this is a confirmation save
         if request.form.get('confirm_save') == 'true':
             # Reconstruct mapping from form
-            mapping = {}
-            for key, value in request.form.items():
-                if key.startswith('mapping_') and value:
-                    original_header = key.replace('mapping_', '')
-                    mapping[original_header] = value
+            mapping = mapping_from_form(request.form)
             
             result = process_team_csv(session, org.id, csv_data, mapping)
             
@@ -1980,11 +2304,7 @@ def bulk_team_upload():
         # Check if this is a mapping step
         if request.form.get('mapping_step') == 'true':
             # Reconstruct mapping from form
-            mapping = {}
-            for key, value in request.form.items():
-                if key.startswith('mapping_') and value:
-                    original_header = key.replace('mapping_', '')
-                    mapping[original_header] = value
+            mapping = mapping_from_form(request.form)
                     
             preview = preview_team_csv(csv_data, mapping)
             return render_template('bulk_team_upload.html',
@@ -1996,7 +2316,7 @@ def bulk_team_upload():
                                  auto_mapped=False)
 
         # Initial upload - analyze and show mapping
-        analysis = analyze_team_csv_columns(csv_data)
+        analysis = analyze_team_csv_columns(sheet_rows if sheet_rows is not None else csv_data)
         
         # Always show mapping step to allow user to guide the import
         return render_template('bulk_team_upload.html',
@@ -2013,119 +2333,138 @@ def bulk_team_upload():
         session.close()
 
 
+def write_contact_batch(session, new_team_rows, new_contacts, updated_contacts):
+    """
+    Write the team and contact rows buffered by process_team_contact_csv
+    and clear the buffers. The caller commits.
+    """
+    if new_team_rows:
+        session.execute(insert(Team), new_team_rows)
+        new_team_rows.clear()
+    if new_contacts:
+        session.execute(insert(TeamContact), list(new_contacts.values()))
+        new_contacts.clear()
+    if updated_contacts:
+        session.execute(update(TeamContact), list(updated_contacts.values()))
+        updated_contacts.clear()
+
 def process_team_contact_csv(session, organization_id, csv_data, update_existing=False, mapping=None, selected_indices=None):
     """
     Process CSV data for team contacts
     """
+    # Rows written by batches that have already been committed, reported if
+    # a later batch fails
+    committed_created = 0
+    committed_updated = 0
+    errors = []
+    
     try:
-        # Parse CSV
+        # Parse CSV - rows are read one at a time, split on the delimiter
+        # analyze_csv_columns detected for the mapping
+        delimiter = ','
         if isinstance(csv_data, str):
-            df = pd.read_csv(io.StringIO(csv_data), dtype=str)
-        else:
-            df = csv_data
-            
-        # Apply mapping if provided
-        if mapping:
-            # Invert mapping to rename columns: {csv_col: db_field} -> rename(columns={csv_col: db_field})
-            # But we need to be careful if multiple csv cols map to same db field (not allowed in UI but possible)
-            df = df.rename(columns=mapping)
+            delimiter = sniff_csv_delimiter(csv_data.strip())
+            csv_data = io.StringIO(csv_data)
+        reader = csv.reader(csv_data, delimiter=delimiter)
             
-        # Normalize columns
-        df.columns = [c.lower().strip() for c in df.columns]
+        # Apply mapping if provided ({csv_col: db_field}), then normalize columns
+        mapping = mapping or {}
+        columns = [mapping.get(header, header).lower().strip() for header in next(reader, [])]
+        
+        # Columns that may hold a team name when no team column is filled in
+        team_name_columns = [column for column in columns if column and ('team' in column or 'name' in column)]
         
         created_count = 0
         updated_count = 0
-        errors = []
         
-        # Iterate rows
-        for index, row in df.iterrows():
+        # Load existing teams and contacts once rather than querying per row
+        teams_by_name = {
+            name.lower().strip(): name
+            for (name,) in session.query(Team.name).filter_by(organization_id=organization_id)
+        }
+        contacts_by_team = {
+            row.team_name: dict(row._mapping)
+            for row in session.query(
+                TeamContact.id, TeamContact.team_name, TeamContact.contact_name,
+                TeamContact.email, TeamContact.phone, TeamContact.role, TeamContact.notes
+            ).filter_by(organization_id=organization_id)
+        }
+        
+        # New teams, new contacts and changed contacts are buffered as plain
+        # dicts and written in bulk every CONTACT_IMPORT_BATCH_SIZE rows
+        new_team_rows = []
+        new_contacts = {}
+        updated_contacts = {}
+        
+        # Iterate rows, skipping blank lines
+        for index, values in enumerate(values for values in reader if values):
             # Skip if not in selected_indices (if provided)
             if selected_indices is not None and index not in selected_indices:
                 continue
                 
             try:
+                row = {column: value.strip() for column, value in zip(columns, values)}
+                
                 # Get team name
-                team_name = None
-                if 'team_name' in row:
-                    team_name = str(row['team_name']).strip()
-                elif 'team' in row:
-                    team_name = str(row['team']).strip()
+                team_name = row.get('team_name') if 'team_name' in row else row.get('team')
                     
-                if not team_name or pd.isna(team_name) or team_name.lower() == 'nan':
+                if not team_name:
                     # Try to find a column that looks like a team name
-                    for key in row.keys():
-                        if key and ('team' in key.lower() or 'name' in key.lower()):
-                            val = str(row[key]).strip()
-                            if val and val.lower() != 'nan':
-                                team_name = val
-                                break
+                    team_name = next((row[key] for key in team_name_columns if row.get(key)), None)
                     
                     if not team_name:
                         continue
 
                 # Get or create team
-                team = session.query(Team).filter_by(
-                    organization_id=organization_id, 
-                    name=team_name
-                ).first()
+                existing_name = teams_by_name.get(team_name.lower())
                 
-                if not team:
-                    team = Team(
-                        organization_id=organization_id,
-                        name=team_name,
-                        is_managed=False
-                    )
-                    session.add(team)
-                    session.flush() # Get ID
+                if existing_name:
+                    team_name = existing_name
+                else:
+                    new_team_rows.append({
+                        'organization_id': organization_id,
+                        'name': team_name,
+                        'is_managed': False
+                    })
+                    teams_by_name[team_name.lower()] = team_name
                 
-                # Get contact details
+                # Get contact details - values are already stripped strings
                 contact_name = row.get('contact_name') or row.get('name') or row.get('contact') or ''
                 email = row.get('email') or row.get('email_address') or ''
                 phone = row.get('phone') or row.get('phone_number') or row.get('mobile') or ''
                 role = row.get('role') or row.get('position') or row.get('title') or ''
                 notes = row.get('notes') or row.get('comments') or ''
                 
-                # Clean up data
-                if pd.isna(contact_name): contact_name = ''
-                if pd.isna(email): email = ''
-                if pd.isna(phone): phone = ''
-                if pd.isna(role): role = ''
-                if pd.isna(notes): notes = ''
-                
-                contact_name = str(contact_name).strip()
-                email = str(email).strip()
-                phone = str(phone).strip()
-                role = str(role).strip()
-                notes = str(notes).strip()
-                
                 if not contact_name and not email:
                     continue
                     
-                # Check for existing contact
-                contact = session.query(TeamContact).filter_by(
-                    organization_id=organization_id,
-                    team_id=team.id
-                ).first()
+                # Check for existing contact - unique per team name
+                contact = contacts_by_team.get(team_name)
                 
                 if contact:
                     if update_existing:
-                        contact.contact_name = contact_name or contact.contact_name
-                        contact.email = email or contact.email
-                        contact.phone = phone or contact.phone
-                        contact.role = role or contact.role
-                        contact.notes = notes or contact.notes
+                        contact['contact_name'] = contact_name or contact['contact_name']
+                        contact['email'] = email or contact['email']
+                        contact['phone'] = phone or contact['phone']
+                        contact['role'] = role or contact['role']
+                        contact['notes'] = notes or contact['notes']
+                        # A contact still waiting to be inserted picks up the change
+                        if team_name not in new_contacts:
+                            updated_contacts[contact['id']] = contact
                         updated_count += 1
                 else:
-                    contact = TeamContact(
-                        organization_id=organization_id,
-                        team_id=team.id,
-                        contact_name=contact_name,
-                        email=email,
-                        phone=phone,
-                        role=role,
-                        notes=notes
-                    )
-                    session.add(contact)
+                    contact = {
+                        'id': uuid.uuid4(),
+                        'organization_id': organization_id,
+                        'team_name': team_name,
+                        'contact_name': contact_name,
+                        'email': email,
+                        'phone': phone,
+                        'role': role,
+                        'notes': notes
+                    }
+                    contacts_by_team[team_name] = contact
+                    new_contacts[team_name] = contact
                     created_count += 1
                     
             except Exception as e:
@@ -2133,7 +2472,15 @@ def process_team_contact_csv(session, organization_id, csv_data, update_existing
                     'row': index + 2, # 1-based + header
                     'message': str(e)
                 })
+                continue
+            
+            # Database errors here are not row errors - they end the import
+            if len(new_team_rows) + len(new_contacts) + len(updated_contacts) >= CONTACT_IMPORT_BATCH_SIZE:
+                write_contact_batch(session, new_team_rows, new_contacts, updated_contacts)
+                session.commit()
+                committed_created, committed_updated = created_count, updated_count
                 
+        write_contact_batch(session, new_team_rows, new_contacts, updated_contacts)
         session.commit()
         
         return {
@@ -2148,11 +2495,71 @@ def process_team_contact_csv(session, organization_id, csv_data, update_existing
         return {
             'success': False,
             'message': str(e),
-            'created': 0,
-            'updated': 0,
-            'errors': []
+            'created': committed_created,
+            'updated': committed_updated,
+            'errors': errors
         }
                     
+@dataclass(frozen=True, slots=True)
+class TeamCsvRow:
+    """A team parsed from a CSV upload"""
+    row_num: int
+    team_name: str
+    age_group: Optional[str] = None
+
+def _first_cell(row, columns):
+    """Return the first non-blank cell of row among columns as one stripped line, or ''"""
+    for column in columns:
+        if column < len(row):
+            value = row[column].translate(_CELL_WHITESPACE).strip()
+            if value:
+                return value
+    return ''
+
+def parse_team_csv(csv_data, mapping=None):
+    """
+    Parse team CSV text into TeamCsvRow rows and (row_num, message) errors. mapping is {csv_header: field};
+    without it the team name and age group columns are detected from the
+    headers.
+    """
+    reader = csv.reader(io.StringIO(csv_data))
+    # Skip leading blank lines here rather than copying the text to strip it
+    headers = next((row for row in reader if ''.join(row).strip()), [])
+    
+    if mapping:
+        # Resolve the mapped headers to column positions once
+        column_index = {header: i for i, header in enumerate(headers)}
+        name_columns = [column_index[h] for h, field in mapping.items() if field == 'team_name' and h in column_index]
+        age_columns = [column_index[h] for h, field in mapping.items() if field == 'age_group' and h in column_index]
+    else:
+        # Fallback to auto-detection, using the first column for the name
+        # if no team/name column has a value
+        lowered = [header.lower() for header in headers]
+        name_columns = [i for i, h in enumerate(lowered) if 'team' in h or 'name' in h] + [0]
+        age_columns = [i for i, h in enumerate(lowered) if 'age' in h or 'group' in h][:1]
+    
+    rows = []
+    errors = []
+    for row in reader:
+        if not ''.join(row).strip():
+            continue
+        row_num = reader.line_num
+        team_name = _first_cell(row, name_columns)
+        if not team_name:
+            errors.append((row_num, 'Missing team name'))
+            continue
+        rows.append(TeamCsvRow(row_num, team_name, _first_cell(row, age_columns) or None))
+    
+    return rows, errors
+
+def rows_to_csv(headers, rows):
+    """Serialize row dicts to CSV text, e.g. for the hidden csv_data form field"""
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=headers, restval='')
+    writer.writeheader()
+    writer.writerows(rows)
+    return output.getvalue()
+
 def process_team_csv(session, organization_id, csv_data, column_mapping=None):
     """Process CSV data for bulk team upload"""
     result = {
@@ -2164,75 +2571,61 @@ def process_team_csv(session, organization_id, csv_data, column_mapping=None):
     }
 
     try:
-        from models import Team
-        
-        csv_file = io.StringIO(csv_data.strip())
-        reader = csv.DictReader(csv_file)
+        parsed_rows, errors = parse_team_csv(csv_data, column_mapping)
+        result['errors'] = [{'row': row_num, 'message': message} for row_num, message in errors]
 
-        for row_num, row in enumerate(reader, start=2):
-            try:
-                team_name = ''
-                age_group = None
-
-                # Use column mapping if provided
-                if column_mapping:
-                    for csv_header, our_field in column_mapping.items():
-                        value = row.get(csv_header, '').strip()
-                        if our_field == 'team_name':
-                            team_name = value
-                        elif our_field == 'age_group':
-                            age_group = value or None
-                else:
-                    # Fallback to auto-detection
-                    for key in row.keys():
-                        if key and ('team' in key.lower() or 'name' in key.lower()):
-                            team_name = row[key].strip()
-                            if team_name:
-                                break
-                    
-                    if not team_name:
-                        team_name = list(row.values())[0].strip() if row.values() else None
-                    
-                    for key in row.keys():
-                        if key and ('age' in key.lower() or 'group' in key.lower()):
-                            age_group = row[key].strip() or None
-                            break
-                
-                if not team_name:
-                    result['errors'].append({
-                        'row': row_num,
-                        'message': 'No team name found'
-                    })
-                    continue
-
-                # Check if team already exists
-                existing_team = session.query(Team).filter_by(
-                    organization_id=organization_id,
-                    name=team_name
-                ).first()
-                
-                if existing_team:
-                    result['updated'] += 1
-                else:
-                    new_team = Team(
-                        organization_id=organization_id,
-                        name=team_name,
-                        age_group=age_group,
-                        is_managed=False,
-                        created_at=datetime.utcnow(),
-                        updated_at=datetime.utcnow()
+        # Work through the rows a chunk at a time, so only one chunk of new
+        # team rows is held at once, and commit once at the end
+        seen_names = set()
+        existing_count = 0
+        created_count = 0
+        now = datetime.utcnow()
+        for start in range(0, len(parsed_rows), UPSERT_CHUNK_SIZE):
+            chunk = parsed_rows[start:start + UPSERT_CHUNK_SIZE]
+            
+            # Look up only the names in this chunk not already seen
+            chunk_names = {row.team_name.lower() for row in chunk} - seen_names
+            if chunk_names:
+                seen_names.update(
+                    name.lower()
+                    for (name,) in session.query(Team.name).filter(
+                        Team.organization_id == organization_id,
+                        func.lower(Team.name).in_(chunk_names)
                     )
-                    session.add(new_team)
-                    result['created'] += 1
-
-            except Exception as e:
-                result['errors'].append({
-                    'row': row_num,
-                    'message': f'Error processing row: {str(e)}'
+                )
+            
+            new_team_rows = []
+            for row in chunk:
+                # Check if team already exists, ignoring case
+                name_key = row.team_name.lower()
+                if name_key in seen_names:
+                    existing_count += 1
+                    continue
+                new_team_rows.append({
+                    'organization_id': organization_id,
+                    'name': row.team_name,
+                    'age_group': row.age_group,
+                    'is_managed': False,
+                    'created_at': now,
+                    'updated_at': now
                 })
-                continue
-
+                seen_names.add(name_key)
+            
+            if new_team_rows:
+                # Names added by a concurrent import since the lookup are
+                # skipped by the unique constraint and counted as existing
+                inserted = len(session.execute(
+                    pg_insert(Team.__table__)
+                    .values(new_team_rows)
+                    .on_conflict_do_nothing(index_elements=['organization_id', 'name'])
+                    .returning(Team.__table__.c.id)
+                ).all())
+                created_count += inserted
+                existing_count += len(new_team_rows) - inserted
         session.commit()
+        
+        result['created'] = created_count
+        result['updated'] = existing_count
 
         if result['errors']:
             result['message'] = f'Processed with {len(result["errors"])} errors'
@@ -2248,7 +2641,7 @@ def process_team_csv(session, organization_id, csv_data, column_mapping=None):
 
 
 def analyze_team_csv_columns(csv_data):
-    """Analyze CSV columns for team data"""
+    """Analyze CSV columns (text or row dicts) for team data"""
     analysis = {
         'headers': [],
         'sample_rows': [],
@@ -2258,35 +2651,36 @@ def analyze_team_csv_columns(csv_data):
     }
     
     try:
-        csv_file = io.StringIO(csv_data.strip())
-        reader = csv.DictReader(csv_file)
-        
-        # Get headers
-        analysis['headers'] = reader.fieldnames or []
-        
-        # Get sample rows
-        for i, row in enumerate(reader):
-            if i < 3:
-                analysis['sample_rows'].append(row)
-            else:
-                break
+        if isinstance(csv_data, str):
+            rows = (row for row in csv.reader(io.StringIO(csv_sample(csv_data))) if ''.join(row).strip())
+            # Get headers
+            analysis['headers'] = next(rows, [])
+            
+            # Get sample rows, only building dicts for the rows shown
+            for row in rows:
+                if len(analysis['sample_rows']) >= 3:
+                    break
+                analysis['sample_rows'].append(dict(zip(analysis['headers'], row)))
+        else:
+            rows = list(csv_data)
+            analysis['headers'] = list(dict.fromkeys(key for row in rows for key in row))
+            analysis['sample_rows'] = rows[:3]
         
-        # Suggest mappings
+        # Suggest mappings, stopping once both fields have a column
+        mapped_fields = set()
         for header in analysis['headers']:
-            header_lower = header.lower()
+            match = _TEAM_HEADER_RE.match(header.strip())
+            if match:
+                field, score = _TEAM_HEADER_SUGGESTIONS[match.lastgroup]
+                analysis['suggested_mapping'][header] = field
+                analysis['confidence_scores'][header] = score
+                mapped_fields.add(field)
             
-            if 'team' in header_lower and 'name' in header_lower:
-                analysis['suggested_mapping'][header] = 'team_name'
-                analysis['confidence_scores'][header] = 95
-            elif 'team' in header_lower or header_lower == 'name':
-                analysis['suggested_mapping'][header] = 'team_name'
-                analysis['confidence_scores'][header] = 85
-            elif 'age' in header_lower or 'group' in header_lower:
-                analysis['suggested_mapping'][header] = 'age_group'
-                analysis['confidence_scores'][header] = 90
+            if len(mapped_fields) == 2:
+                break
         
         # Check if we have team_name mapped
-        if 'team_name' not in analysis['suggested_mapping'].values():
+        if 'team_name' not in mapped_fields:
             analysis['needs_manual_mapping'] = True
             
     except Exception as e:
@@ -2305,32 +2699,13 @@ def preview_team_csv(csv_data, column_mapping):
     }
 
     try:
-        csv_file = io.StringIO(csv_data.strip())
-        reader = csv.DictReader(csv_file)
-
-        for row_num, row in enumerate(reader, start=2):
-            preview_data['total_rows'] += 1
-
-            team_data = {
-                'row_num': row_num,
-                'team_name': '',
-                'age_group': ''
-            }
-
-            for csv_header, our_field in column_mapping.items():
-                value = row.get(csv_header, '').strip()
-                if our_field in team_data:
-                    team_data[our_field] = value or team_data[our_field]
-
-            if not team_data['team_name']:
-                preview_data['errors'].append({
-                    'row': row_num,
-                    'message': 'Missing team name',
-                    'data': team_data
-                })
-                continue
-
-            preview_data['teams'].append(team_data)
+        rows, errors = parse_team_csv(csv_data, column_mapping)
+        preview_data['total_rows'] = len(rows) + len(errors)
+        preview_data['teams'] = list(rows)
+        preview_data['errors'] = [
+            {'row': row_num, 'message': message, 'data': {}}
+            for row_num, message in errors
+        ]
 
     except Exception as e:
         preview_data['errors'].append({
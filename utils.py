@@ -1,19 +1,33 @@
+from flask import g
 from flask_login import current_user
 from database import db_manager
 from models import User
 
 def get_user_organization():
-    """Get the current user's organization"""
-    if current_user.is_authenticated:
-        session = db_manager.get_session()
-        try:
-            user = session.query(User).filter_by(id=current_user.id).first()
-            if user and user.owned_organizations:
-                return user.owned_organizations[0]
-            return None
-        finally:
-            session.close()
-    return None
+    """
+    Get the current user's organization.
+    The result is kept on flask.g so repeated calls in one request
+    only query the database once.
+    """
+    if not current_user.is_authenticated:
+        return None
+    cached = g.get('_user_organization')
+    if cached is not None and cached[0] == current_user.id:
+        return cached[1]
+    org = _load_user_organization(current_user.id)
+    g._user_organization = (current_user.id, org)
+    return org
+
+def _load_user_organization(user_id):
+    """Query the first organization owned by the given user"""
+    session = db_manager.get_session()
+    try:
+        user = session.query(User).filter_by(id=user_id).first()
+        if user and user.owned_organizations:
+            return user.owned_organizations[0]
+        return None
+    finally:
+        session.close()
 
 def get_user_organization_id():
     """Get the current user's organization ID"""